@@ -42,7 +42,9 @@ class DNS(pulumi.ComponentResource):
                 api_url=api_url,
                 cpgw_api_key=cpgw_api_key,
             ),
-            opts=pulumi.ResourceOptions(parent=self, depends_on=[self.zone]),
+            opts=pulumi.ResourceOptions.merge(
+                child_opts, pulumi.ResourceOptions(depends_on=[self.zone])
+            ),
         )
 
         # create CNAME records pointing to ingress (public ALB)
@@ -71,10 +73,12 @@ class DNS(pulumi.ComponentResource):
             ],
             validation_method="DNS",
             tags={**tags, "Name": f"{name}-cert"},
-            opts=pulumi.ResourceOptions(
-                parent=self,
-                depends_on=[self.delegation],
-                retain_on_delete=True,  # cert may be in use by ALBs
+            opts=pulumi.ResourceOptions.merge(
+                child_opts,
+                pulumi.ResourceOptions(
+                    depends_on=[self.delegation],
+                    retain_on_delete=True,  # cert may be in use by ALBs
+                ),
             ),
         )
 
@@ -99,7 +103,9 @@ class DNS(pulumi.ComponentResource):
             f"{name}-cert-validation",
             certificate_arn=self.certificate.arn,
             validation_record_fqdns=[r.fqdn for r in validation_records],
-            opts=pulumi.ResourceOptions(parent=self, depends_on=validation_records),
+            opts=pulumi.ResourceOptions.merge(
+                child_opts, pulumi.ResourceOptions(depends_on=validation_records)
+            ),
         )
 
         # private endpoint certificate - for PrivateLink access
@@ -113,10 +119,12 @@ class DNS(pulumi.ComponentResource):
             subject_alternative_names=self._private_dns_domains[1:],
             validation_method="DNS",
             tags={**tags, "Name": f"{name}-private-cert"},
-            opts=pulumi.ResourceOptions(
-                parent=self,
-                depends_on=[self.delegation],
-                retain_on_delete=True,
+            opts=pulumi.ResourceOptions.merge(
+                child_opts,
+                pulumi.ResourceOptions(
+                    depends_on=[self.delegation],
+                    retain_on_delete=True,
+                ),
             ),
         )
 
@@ -141,7 +149,9 @@ class DNS(pulumi.ComponentResource):
             f"{name}-private-cert-validation",
             certificate_arn=self.private_certificate.arn,
             validation_record_fqdns=[r.fqdn for r in private_validation_records],
-            opts=pulumi.ResourceOptions(parent=self, depends_on=private_validation_records),
+            opts=pulumi.ResourceOptions.merge(
+                child_opts, pulumi.ResourceOptions(depends_on=private_validation_records)
+            ),
         )
 
         self._fqdn = fqdn
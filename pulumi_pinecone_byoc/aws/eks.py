@@ -14,6 +14,7 @@ import pulumi_kubernetes as k8s
 
 from config.aws import AWSConfig
 
+from ..common.naming import as_output
 from .vpc import VPC
 
 # https://docs.aws.amazon.com/eks/latest/userguide/clusters.html
@@ -40,7 +41,7 @@ class EKS(pulumi.ComponentResource):
         super().__init__("pinecone:byoc:EKS", name, None, opts)
 
         self.config = config
-        self._cell_name = pulumi.Output.from_input(cell_name)
+        self._cell_name = as_output(cell_name)
         self._resource_suffix = self._cell_name.apply(lambda cn: cn[-4:])
         child_opts = pulumi.ResourceOptions(parent=self)
 
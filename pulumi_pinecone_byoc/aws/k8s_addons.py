@@ -1,4 +1,5 @@
 import json
+from functools import partial
 
 import pulumi
 import pulumi_aws as aws
@@ -7,6 +8,7 @@ from pulumi_kubernetes.helm.v3 import Release, ReleaseArgs
 
 from config.aws import AWSConfig
 
+from ..common.naming import as_output
 from .eks import EKS
 
 AWS_LOAD_BALANCER_POLICY = {
@@ -221,6 +223,86 @@ AWS_LOAD_BALANCER_POLICY = {
 }
 
 
+CLUSTER_AUTOSCALER_POLICY = {
+    "Version": "2012-10-17",
+    "Statement": [
+        {
+            "Effect": "Allow",
+            "Action": [
+                "autoscaling:DescribeAutoScalingGroups",
+                "autoscaling:DescribeAutoScalingInstances",
+                "autoscaling:DescribeLaunchConfigurations",
+                "autoscaling:DescribeScalingActivities",
+                "autoscaling:DescribeTags",
+                "ec2:DescribeInstanceTypes",
+                "ec2:DescribeLaunchTemplateVersions",
+                "ec2:DescribeImages",
+                "ec2:GetInstanceTypesFromInstanceRequirements",
+                "eks:DescribeNodegroup",
+            ],
+            "Resource": "*",
+        },
+        {
+            "Effect": "Allow",
+            "Action": [
+                "autoscaling:SetDesiredCapacity",
+                "autoscaling:TerminateInstanceInAutoScalingGroup",
+            ],
+            "Resource": "*",
+        },
+    ],
+}
+
+
+AZREBALANCE_POLICY = {
+    "Version": "2012-10-17",
+    "Statement": [
+        {
+            "Effect": "Allow",
+            "Action": [
+                "autoscaling:DescribeAutoScalingGroups",
+                "autoscaling:SuspendProcesses",
+            ],
+            "Resource": "*",
+        }
+    ],
+}
+
+_JSON_SEPARATORS = (",", ":")
+_dumps = partial(json.dumps, separators=_JSON_SEPARATORS)
+
+AWS_LOAD_BALANCER_POLICY_JSON = _dumps(AWS_LOAD_BALANCER_POLICY)
+CLUSTER_AUTOSCALER_POLICY_JSON = _dumps(CLUSTER_AUTOSCALER_POLICY)
+AZREBALANCE_POLICY_JSON = _dumps(AZREBALANCE_POLICY)
+
+
+def _external_dns_policy(zone_id: str) -> str:
+    return _dumps(
+        {
+            "Version": "2012-10-17",
+            "Statement": [
+                {
+                    "Effect": "Allow",
+                    "Action": [
+                        "route53:ChangeResourceRecordSets",
+                    ],
+                    "Resource": f"arn:aws:route53:::hostedzone/{zone_id}",
+                },
+                {
+                    "Effect": "Allow",
+                    "Action": [
+                        "route53:ListHostedZones",
+                        "route53:ListHostedZonesByName",
+                        "route53:ListResourceRecordSets",
+                        "route53:GetChange",
+                    ],
+                    "Resource": "*",
+                },
+            ],
+        }
+    )
+
+
 class K8sAddons(pulumi.ComponentResource):
     def __init__(
         self,
@@ -235,66 +317,85 @@ class K8sAddons(pulumi.ComponentResource):
         super().__init__("pinecone:byoc:K8sAddons", name, None, opts)
 
         self.config = config
-        self._cell_name = pulumi.Output.from_input(cell_name)
+        self._tags = config.tags()
+        self._cell_name = as_output(cell_name)
         # resource_suffix for unique AWS resource names (last 4 chars of cell_name)
         self._resource_suffix = self._cell_name.apply(lambda cn: cn[-4:])
+        self._oidc_issuer = eks.oidc_provider_url.apply(lambda u: u.removeprefix("https://"))
         child_opts = pulumi.ResourceOptions(parent=self)
+        k8s_opts = pulumi.ResourceOptions(parent=self, provider=eks.provider)
 
-        self.gloo_namespace = self._create_gloo_namespace(name, eks.provider, child_opts)
+        self.gloo_namespace = self._create_gloo_namespace(name, k8s_opts)
 
-        self.alb_controller_role = self._create_alb_controller_role(
+        self.alb_controller_role = self._create_irsa_role(
             name,
+            "alb-controller",
             eks.oidc_provider_arn,
-            eks.oidc_provider_url,
-            child_opts,
+            "kube-system",
+            "aws-lb-controller-sa",
+            opts=child_opts,
+            policy=AWS_LOAD_BALANCER_POLICY_JSON,
         )
 
         self.alb_controller = self._create_alb_controller(
             name,
-            eks.provider,
             eks.cluster_name,
             vpc_id,
             self.alb_controller_role.arn,
-            pulumi.ResourceOptions(parent=self, depends_on=[self.alb_controller_role]),
+            k8s_opts,
         )
 
-        self.cluster_autoscaler_role = self._create_cluster_autoscaler_role(
+        self.cluster_autoscaler_role = self._create_irsa_role(
             name,
+            "cluster-autoscaler",
             eks.oidc_provider_arn,
-            eks.oidc_provider_url,
-            child_opts,
+            "kube-system",
+            "cluster-autoscaler-sa",
+            opts=child_opts,
+            policy=CLUSTER_AUTOSCALER_POLICY_JSON,
         )
 
         self.cluster_autoscaler = self._create_cluster_autoscaler(
             name,
-            eks.provider,
             eks.cluster_name,
             self.cluster_autoscaler_role.arn,
-            pulumi.ResourceOptions(parent=self, depends_on=[self.cluster_autoscaler_role]),
+            k8s_opts,
         )
 
-        self.external_dns_role = self._create_external_dns_role(
+        self.external_dns_role = self._create_irsa_role(
             name,
+            "external-dns",
             eks.oidc_provider_arn,
-            eks.oidc_provider_url,
-            hosted_zone_id,
-            child_opts,
+            "gloo-system",
+            "external-dns",
+            "certmanager-certgen",
+            opts=child_opts,
+            policy=pulumi.Output.from_input(hosted_zone_id).apply(_external_dns_policy),
         )
 
         self.external_dns_sa = self._create_external_dns_service_account(
             name,
-            eks.provider,
             self.external_dns_role.arn,
-            pulumi.ResourceOptions(
-                parent=self, depends_on=[self.gloo_namespace, self.external_dns_role]
+            pulumi.ResourceOptions.merge(
+                k8s_opts, pulumi.ResourceOptions(depends_on=[self.gloo_namespace])
             ),
         )
 
-        self.ebs_csi_role = self._create_ebs_csi_role(
+        self.ebs_csi_role = self._create_irsa_role(
             name,
+            "ebs-csi",
             eks.oidc_provider_arn,
-            eks.oidc_provider_url,
-            child_opts,
+            "kube-system",
+            "ebs-csi-controller-sa",
+            opts=child_opts,
+            audience="sts.amazonaws.com",
+        )
+
+        aws.iam.RolePolicyAttachment(
+            f"{name}-ebs-csi-policy",
+            role=self.ebs_csi_role.name,
+            policy_arn="arn:aws:iam::aws:policy/service-role/AmazonEBSCSIDriverPolicy",
+            opts=child_opts,
         )
 
         self.ebs_csi_addon = aws.eks.Addon(
@@ -302,24 +403,25 @@ class K8sAddons(pulumi.ComponentResource):
             cluster_name=eks.cluster_name,
             addon_name="aws-ebs-csi-driver",
             service_account_role_arn=self.ebs_csi_role.arn,
-            tags=config.tags(),
-            opts=pulumi.ResourceOptions(parent=self, depends_on=[self.ebs_csi_role]),
+            tags=self._tags,
+            opts=child_opts,
         )
 
         # Create azrebalance role for suspend-azrebalance cronjob
         self.azrebalance_role = self._create_azrebalance_role(
             name,
             eks.oidc_provider_arn,
-            eks.oidc_provider_url,
             child_opts,
         )
 
         # Create AMP ingest role for Prometheus remote write
-        self.amp_ingest_role = self._create_amp_ingest_role(
+        self.amp_ingest_role = self._create_irsa_role(
             name,
+            "amp-ingest",
             eks.oidc_provider_arn,
-            eks.oidc_provider_url,
-            child_opts,
+            "prometheus",
+            "amp-iamproxy-ingest-service-account",
+            opts=child_opts,
         )
 
         self.register_outputs(
@@ -337,7 +439,6 @@ class K8sAddons(pulumi.ComponentResource):
     def _create_gloo_namespace(
         self,
         name: str,
-        k8s_provider: pulumi.ProviderResource,
         opts: pulumi.ResourceOptions,
     ) -> k8s.core.v1.Namespace:
         return k8s.core.v1.Namespace(
@@ -349,68 +450,76 @@ class K8sAddons(pulumi.ComponentResource):
                     "name": "gloo-system",
                 },
             ),
-            opts=pulumi.ResourceOptions(parent=opts.parent, provider=k8s_provider),
+            opts=opts,
         )
 
     def _create_irsa_trust_policy(
         self,
         oidc_arn: pulumi.Output[str],
-        oidc_url: pulumi.Output[str],
         namespace: str,
-        service_account: str,
+        *service_accounts: str,
+        audience: str | None = None,
     ) -> pulumi.Output[str]:
-        return pulumi.Output.all(oidc_arn, oidc_url).apply(
-            lambda args: json.dumps(
-                {
-                    "Version": "2012-10-17",
-                    "Statement": [
-                        {
-                            "Effect": "Allow",
-                            "Principal": {"Federated": args[0]},
-                            "Action": "sts:AssumeRoleWithWebIdentity",
-                            "Condition": {
-                                "StringEquals": {
-                                    f"{args[1].replace('https://', '')}:sub": f"system:serviceaccount:{namespace}:{service_account}"
-                                }
-                            },
-                        }
-                    ],
-                }
-            )
+        subjects = [f"system:serviceaccount:{namespace}:{sa}" for sa in service_accounts]
+
+        def conditions(issuer: str) -> dict[str, str | list[str]]:
+            result: dict[str, str | list[str]] = {}
+            if audience:
+                result[f"{issuer}:aud"] = audience
+            result[f"{issuer}:sub"] = subjects[0] if len(subjects) == 1 else subjects
+            return result
+
+        return pulumi.Output.json_dumps(
+            {
+                "Version": "2012-10-17",
+                "Statement": [
+                    {
+                        "Effect": "Allow",
+                        "Principal": {"Federated": oidc_arn},
+                        "Action": "sts:AssumeRoleWithWebIdentity",
+                        "Condition": {"StringEquals": self._oidc_issuer.apply(conditions)},
+                    }
+                ],
+            },
+            separators=_JSON_SEPARATORS,
         )
 
-    def _create_alb_controller_role(
+    def _create_irsa_role(
         self,
         name: str,
+        component: str,
         oidc_arn: pulumi.Output[str],
-        oidc_url: pulumi.Output[str],
+        namespace: str,
+        *service_accounts: str,
         opts: pulumi.ResourceOptions,
+        policy: pulumi.Input[str] | None = None,
+        audience: str | None = None,
     ) -> aws.iam.Role:
         role = aws.iam.Role(
-            f"{name}-alb-controller-role",
-            name=self._resource_suffix.apply(
-                lambda s: f"{self.config.resource_prefix}-alb-controller-{s}"
+            f"{name}-{component}-role",
+            name=pulumi.Output.concat(
+                f"{self.config.resource_prefix}-{component}-", self._resource_suffix
             ),
             assume_role_policy=self._create_irsa_trust_policy(
-                oidc_arn, oidc_url, "kube-system", "aws-lb-controller-sa"
+                oidc_arn, namespace, *service_accounts, audience=audience
             ),
-            tags=self.config.tags(Name=f"{self.config.resource_prefix}-alb-controller"),
+            tags={**self._tags, "Name": f"{self.config.resource_prefix}-{component}"},
             opts=opts,
         )
 
-        aws.iam.RolePolicy(
-            f"{name}-alb-controller-policy",
-            role=role.name,
-            policy=json.dumps(AWS_LOAD_BALANCER_POLICY),
-            opts=opts,
-        )
+        if policy is not None:
+            aws.iam.RolePolicy(
+                f"{name}-{component}-policy",
+                role=role.name,
+                policy=policy,
+                opts=opts,
+            )
 
         return role
 
     def _create_alb_controller(
         self,
         name: str,
-        k8s_provider: pulumi.ProviderResource,
         cluster_name: pulumi.Output[str],
         vpc_id: pulumi.Output[str],
         role_arn: pulumi.Output[str],
@@ -423,7 +532,7 @@ class K8sAddons(pulumi.ComponentResource):
                 namespace="kube-system",
                 annotations={"eks.amazonaws.com/role-arn": role_arn},
             ),
-            opts=pulumi.ResourceOptions(parent=opts.parent, provider=k8s_provider),
+            opts=opts,
         )
 
         return Release(
@@ -448,71 +557,12 @@ class K8sAddons(pulumi.ComponentResource):
                     "enableCertManager": False,
                 },
             ),
-            opts=pulumi.ResourceOptions(parent=opts.parent, provider=k8s_provider, depends_on=[sa]),
-        )
-
-    def _create_cluster_autoscaler_role(
-        self,
-        name: str,
-        oidc_arn: pulumi.Output[str],
-        oidc_url: pulumi.Output[str],
-        opts: pulumi.ResourceOptions,
-    ) -> aws.iam.Role:
-        role = aws.iam.Role(
-            f"{name}-cluster-autoscaler-role",
-            name=self._resource_suffix.apply(
-                lambda s: f"{self.config.resource_prefix}-cluster-autoscaler-{s}"
-            ),
-            assume_role_policy=self._create_irsa_trust_policy(
-                oidc_arn, oidc_url, "kube-system", "cluster-autoscaler-sa"
-            ),
-            tags=self.config.tags(Name=f"{self.config.resource_prefix}-cluster-autoscaler"),
-            opts=opts,
+            opts=pulumi.ResourceOptions.merge(opts, pulumi.ResourceOptions(depends_on=[sa])),
         )
 
-        policy = {
-            "Version": "2012-10-17",
-            "Statement": [
-                {
-                    "Effect": "Allow",
-                    "Action": [
-                        "autoscaling:DescribeAutoScalingGroups",
-                        "autoscaling:DescribeAutoScalingInstances",
-                        "autoscaling:DescribeLaunchConfigurations",
-                        "autoscaling:DescribeScalingActivities",
-                        "autoscaling:DescribeTags",
-                        "ec2:DescribeInstanceTypes",
-                        "ec2:DescribeLaunchTemplateVersions",
-                        "ec2:DescribeImages",
-                        "ec2:GetInstanceTypesFromInstanceRequirements",
-                        "eks:DescribeNodegroup",
-                    ],
-                    "Resource": "*",
-                },
-                {
-                    "Effect": "Allow",
-                    "Action": [
-                        "autoscaling:SetDesiredCapacity",
-                        "autoscaling:TerminateInstanceInAutoScalingGroup",
-                    ],
-                    "Resource": "*",
-                },
-            ],
-        }
-
-        aws.iam.RolePolicy(
-            f"{name}-cluster-autoscaler-policy",
-            role=role.name,
-            policy=json.dumps(policy),
-            opts=opts,
-        )
-
-        return role
-
     def _create_cluster_autoscaler(
         self,
         name: str,
-        k8s_provider: pulumi.ProviderResource,
         cluster_name: pulumi.Output[str],
         role_arn: pulumi.Output[str],
         opts: pulumi.ResourceOptions,
@@ -553,89 +603,12 @@ class K8sAddons(pulumi.ComponentResource):
                     },
                 },
             ),
-            opts=pulumi.ResourceOptions(parent=opts.parent, provider=k8s_provider),
-        )
-
-    def _create_external_dns_role(
-        self,
-        name: str,
-        oidc_arn: pulumi.Output[str],
-        oidc_url: pulumi.Output[str],
-        hosted_zone_id: pulumi.Input[str],
-        opts: pulumi.ResourceOptions,
-    ) -> aws.iam.Role:
-        trust_policy = pulumi.Output.all(oidc_arn, oidc_url).apply(
-            lambda args: json.dumps(
-                {
-                    "Version": "2012-10-17",
-                    "Statement": [
-                        {
-                            "Effect": "Allow",
-                            "Principal": {"Federated": args[0]},
-                            "Action": "sts:AssumeRoleWithWebIdentity",
-                            "Condition": {
-                                "StringEquals": {
-                                    f"{args[1].replace('https://', '')}:sub": [
-                                        "system:serviceaccount:gloo-system:external-dns",
-                                        "system:serviceaccount:gloo-system:certmanager-certgen",
-                                    ]
-                                }
-                            },
-                        }
-                    ],
-                }
-            )
-        )
-
-        role = aws.iam.Role(
-            f"{name}-external-dns-role",
-            name=self._resource_suffix.apply(
-                lambda s: f"{self.config.resource_prefix}-external-dns-{s}"
-            ),
-            assume_role_policy=trust_policy,
-            tags=self.config.tags(Name=f"{self.config.resource_prefix}-external-dns"),
             opts=opts,
         )
 
-        def build_policy(zone_id: str) -> str:
-            return json.dumps(
-                {
-                    "Version": "2012-10-17",
-                    "Statement": [
-                        {
-                            "Effect": "Allow",
-                            "Action": [
-                                "route53:ChangeResourceRecordSets",
-                            ],
-                            "Resource": f"arn:aws:route53:::hostedzone/{zone_id}",
-                        },
-                        {
-                            "Effect": "Allow",
-                            "Action": [
-                                "route53:ListHostedZones",
-                                "route53:ListHostedZonesByName",
-                                "route53:ListResourceRecordSets",
-                                "route53:GetChange",
-                            ],
-                            "Resource": "*",
-                        },
-                    ],
-                }
-            )
-
-        aws.iam.RolePolicy(
-            f"{name}-external-dns-policy",
-            role=role.name,
-            policy=pulumi.Output.from_input(hosted_zone_id).apply(build_policy),
-            opts=opts,
-        )
-
-        return role
-
     def _create_external_dns_service_account(
         self,
         name: str,
-        k8s_provider: pulumi.ProviderResource,
         role_arn: pulumi.Output[str],
         opts: pulumi.ResourceOptions,
     ) -> k8s.core.v1.ServiceAccount:
@@ -646,114 +619,32 @@ class K8sAddons(pulumi.ComponentResource):
                 namespace="gloo-system",
                 annotations={"eks.amazonaws.com/role-arn": role_arn},
             ),
-            opts=pulumi.ResourceOptions(parent=opts.parent, provider=k8s_provider),
-        )
-
-    def _create_ebs_csi_role(
-        self,
-        name: str,
-        oidc_arn: pulumi.Output[str],
-        oidc_url: pulumi.Output[str],
-        opts: pulumi.ResourceOptions,
-    ) -> aws.iam.Role:
-        trust_policy = pulumi.Output.all(oidc_arn, oidc_url).apply(
-            lambda args: json.dumps(
-                {
-                    "Version": "2012-10-17",
-                    "Statement": [
-                        {
-                            "Effect": "Allow",
-                            "Principal": {"Federated": args[0]},
-                            "Action": "sts:AssumeRoleWithWebIdentity",
-                            "Condition": {
-                                "StringEquals": {
-                                    f"{args[1].replace('https://', '')}:aud": "sts.amazonaws.com",
-                                    f"{args[1].replace('https://', '')}:sub": "system:serviceaccount:kube-system:ebs-csi-controller-sa",
-                                }
-                            },
-                        }
-                    ],
-                }
-            )
-        )
-
-        role = aws.iam.Role(
-            f"{name}-ebs-csi-role",
-            name=self._resource_suffix.apply(
-                lambda s: f"{self.config.resource_prefix}-ebs-csi-{s}"
-            ),
-            assume_role_policy=trust_policy,
-            tags=self.config.tags(Name=f"{self.config.resource_prefix}-ebs-csi"),
-            opts=opts,
-        )
-
-        aws.iam.RolePolicyAttachment(
-            f"{name}-ebs-csi-policy",
-            role=role.name,
-            policy_arn="arn:aws:iam::aws:policy/service-role/AmazonEBSCSIDriverPolicy",
             opts=opts,
         )
 
-        return role
-
     def _create_azrebalance_role(
         self,
         name: str,
         oidc_arn: pulumi.Output[str],
-        oidc_url: pulumi.Output[str],
         opts: pulumi.ResourceOptions,
     ) -> aws.iam.Role:
         """Create IAM role for suspend-azrebalance cronjob to manage ASG processes."""
-        role_name = self._cell_name.apply(lambda cn: f"control-plane-azrebalance-role-{cn}")
+        role_name = pulumi.Output.concat("control-plane-azrebalance-role-", self._cell_name)
         role = aws.iam.Role(
             f"{name}-azrebalance-role",
             name=role_name,
             assume_role_policy=self._create_irsa_trust_policy(
-                oidc_arn, oidc_url, "pc-control-plane", "suspend-azrebalance-sa"
+                oidc_arn, "pc-control-plane", "suspend-azrebalance-sa"
             ),
-            tags=role_name.apply(lambda rn: self.config.tags(Name=rn)),
+            tags=role_name.apply(lambda rn: {**self._tags, "Name": rn}),
             opts=opts,
         )
 
         aws.iam.RolePolicy(
             f"{name}-azrebalance-policy",
             role=role.id,
-            policy=json.dumps(
-                {
-                    "Version": "2012-10-17",
-                    "Statement": [
-                        {
-                            "Effect": "Allow",
-                            "Action": [
-                                "autoscaling:DescribeAutoScalingGroups",
-                                "autoscaling:SuspendProcesses",
-                            ],
-                            "Resource": "*",
-                        }
-                    ],
-                }
-            ),
+            policy=AZREBALANCE_POLICY_JSON,
             opts=opts,
         )
 
         return role
-
-    def _create_amp_ingest_role(
-        self,
-        name: str,
-        oidc_arn: pulumi.Output[str],
-        oidc_url: pulumi.Output[str],
-        opts: pulumi.ResourceOptions,
-    ) -> aws.iam.Role:
-        """Create IAM role for Prometheus to assume for AMP remote write."""
-        return aws.iam.Role(
-            f"{name}-amp-ingest-role",
-            name=self._resource_suffix.apply(
-                lambda s: f"{self.config.resource_prefix}-amp-ingest-{s}"
-            ),
-            assume_role_policy=self._create_irsa_trust_policy(
-                oidc_arn, oidc_url, "prometheus", "amp-iamproxy-ingest-service-account"
-            ),
-            tags=self.config.tags(Name=f"{self.config.resource_prefix}-amp-ingest"),
-            opts=opts,
-        )
@@ -11,6 +11,8 @@ import pulumi_aws as aws
 
 from config.aws import AWSConfig
 
+from ..common.naming import as_output
+
 
 class PulumiOperator(pulumi.ComponentResource):
     """
@@ -38,7 +40,7 @@ class PulumiOperator(pulumi.ComponentResource):
         super().__init__("pinecone:byoc:PulumiOperator", name, None, opts)
 
         self.config = config
-        self._cell_name = pulumi.Output.from_input(cell_name)
+        self._cell_name = as_output(cell_name)
         self._resource_suffix = self._cell_name.apply(lambda cn: cn[-4:])
         child_opts = pulumi.ResourceOptions(parent=self)
 
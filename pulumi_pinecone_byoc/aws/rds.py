@@ -12,6 +12,7 @@ import pulumi_random as random
 
 from config.aws import AWSConfig, DatabaseInstanceConfig
 
+from ..common.naming import as_output
 from .vpc import VPC
 
 
@@ -38,7 +39,7 @@ class RDSInstance(pulumi.ComponentResource):
 
         self.config = config
         self.db_config = db_config
-        self._resource_suffix = pulumi.Output.from_input(resource_suffix)
+        self._resource_suffix = as_output(resource_suffix)
         child_opts = pulumi.ResourceOptions(parent=self)
 
         self._random_password = random.RandomPassword(
@@ -209,7 +210,7 @@ class RDS(pulumi.ComponentResource):
         super().__init__("pinecone:byoc:RDS", name, None, opts)
 
         self.config = config
-        self._cell_name = pulumi.Output.from_input(cell_name)
+        self._cell_name = as_output(cell_name)
         self._resource_suffix = self._cell_name.apply(lambda cn: cn[-4:])
         child_opts = pulumi.ResourceOptions(parent=self)
 
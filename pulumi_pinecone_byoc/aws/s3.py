@@ -9,6 +9,8 @@ import pulumi_aws as aws
 
 from config.aws import AWSConfig
 
+from ..common.naming import as_output
+
 # https://docs.aws.amazon.com/AmazonS3/latest/userguide/bucketnamingrules.html
 AWS_S3_BUCKET_NAME_LIMIT = 63
 
@@ -36,7 +38,7 @@ class S3Buckets(pulumi.ComponentResource):
         super().__init__("pinecone:byoc:S3Buckets", name, None, opts)
 
         self.config = config
-        self._cell_name = pulumi.Output.from_input(cell_name)
+        self._cell_name = as_output(cell_name)
         self._force_destroy = force_destroy
         child_opts = pulumi.ResourceOptions(parent=self)
 
@@ -12,6 +12,8 @@ from pulumi_azure_native import authorization, containerservice, managedidentity
 from config.azure import AzureConfig
 from config.base import NodePoolConfig
 
+from ..common.naming import as_output
+
 _AGENT_POOL_NAME_MAX_LEN = 12
 
 
@@ -32,7 +34,7 @@ class AKS(pulumi.ComponentResource):
     ):
         super().__init__("pinecone:byoc:AKS", name, None, opts)
 
-        self._cell_name = pulumi.Output.from_input(cell_name)
+        self._cell_name = as_output(cell_name)
 
         # cluster managed identity
         cluster_identity = managedidentity.UserAssignedIdentity(
@@ -7,6 +7,8 @@ import pulumi_random as random
 
 from config.azure import AzureConfig
 
+from ..common.naming import as_output
+
 
 class _FlexibleServerClusterCompat:
     """Mimics RDS cluster interface for K8sSecrets compatibility."""
@@ -86,7 +88,7 @@ class Database(pulumi.ComponentResource):
     ):
         super().__init__("pinecone:byoc:Database", name, None, opts)
 
-        self._cell_name = pulumi.Output.from_input(cell_name)
+        self._cell_name = as_output(cell_name)
 
         private_dns_zone = network.PrivateZone(
             f"{name}-private-dns-zone",
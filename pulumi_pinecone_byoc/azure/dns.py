@@ -3,7 +3,7 @@
 import pulumi
 from pulumi_azure_native import network
 
-from ..common.naming import DNS_CNAMES
+from ..common.naming import DNS_CNAME_SLUGS, as_output
 from ..common.providers import DnsDelegation, DnsDelegationArgs
 
 
@@ -23,7 +23,7 @@ class DNS(pulumi.ComponentResource):
     ):
         super().__init__("pinecone:byoc:DNS", name, None, opts)
 
-        self._cell_name = pulumi.Output.from_input(cell_name)
+        self._cell_name = as_output(cell_name)
         child_opts = pulumi.ResourceOptions(parent=self)
 
         def build_fqdn(sub: str) -> str:
@@ -70,9 +70,9 @@ class DNS(pulumi.ComponentResource):
         )
 
         cname_records = []
-        for cname in DNS_CNAMES:
+        for cname, slug in DNS_CNAME_SLUGS:
             cname_record = network.RecordSet(
-                f"{name}-{cname.replace('*.', 'wildcard-').replace('.', '-')}-cname",
+                f"{name}-{slug}-cname",
                 zone_name=dns_zone.name,
                 relative_record_set_name=cname,
                 record_type="CNAME",
@@ -8,6 +8,8 @@ from pulumi_azure_native import authorization, managedidentity
 
 from config.azure import AzureConfig
 
+from ..common.naming import as_output
+
 # built-in Azure role definition IDs
 DNS_ZONE_CONTRIBUTOR_ROLE = "befefa01-2a29-4197-83a8-272ff33ce314"
 
@@ -27,8 +29,8 @@ class K8sAddons(pulumi.ComponentResource):
     ):
         super().__init__("pinecone:byoc:K8sAddons", name, None, opts)
 
-        self._cell_name = pulumi.Output.from_input(cell_name)
-        self._rg_name = pulumi.Output.from_input(resource_group_name)
+        self._cell_name = as_output(cell_name)
+        self._rg_name = as_output(resource_group_name)
         child_opts = pulumi.ResourceOptions(parent=self)
         k8s_opts = pulumi.ResourceOptions(parent=self, provider=k8s_provider)
 
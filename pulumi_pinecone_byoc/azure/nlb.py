@@ -6,7 +6,7 @@ from pulumi_azure_native import network
 
 from config.azure import AzureConfig
 
-from ..common.naming import DNS_CNAMES
+from ..common.naming import DNS_CNAME_SLUGS, as_output
 
 
 class InternalLoadBalancer(pulumi.ComponentResource):
@@ -26,7 +26,7 @@ class InternalLoadBalancer(pulumi.ComponentResource):
     ):
         super().__init__("pinecone:byoc:InternalLoadBalancer", name, None, opts)
 
-        self._cell_name = pulumi.Output.from_input(cell_name)
+        self._cell_name = as_output(cell_name)
 
         tls_secret_name = subdomain.apply(lambda s: f"{s.split('.')[0]}-tls")
 
@@ -229,9 +229,9 @@ class InternalLoadBalancer(pulumi.ComponentResource):
 
         # private CNAME records: {cname}.private -> private.{zone}
         private_cname_records = []
-        for cname in DNS_CNAMES:
+        for cname, slug in DNS_CNAME_SLUGS:
             private_cname = network.RecordSet(
-                f"{name}-{cname.replace('*.', 'wildcard-').replace('.', '-')}-private-cname",
+                f"{name}-{slug}-private-cname",
                 resource_group_name=resource_group_name,
                 zone_name=dns_zone_name,
                 relative_record_set_name=f"{cname}.private",
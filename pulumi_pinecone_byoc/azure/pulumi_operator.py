@@ -5,6 +5,7 @@ import pulumi_azure_native as azure_native
 
 from config.azure import AzureConfig
 
+from ..common.naming import as_output
 from .naming import key_vault_name
 
 
@@ -25,12 +26,12 @@ class PulumiOperator(pulumi.ComponentResource):
         super().__init__("pinecone:byoc:PulumiOperator", name, None, opts)
 
         self.config = config
-        self._cell_name = pulumi.Output.from_input(cell_name)
-        self._resource_group_name = pulumi.Output.from_input(resource_group_name)
-        self._resource_group_id = pulumi.Output.from_input(resource_group_id)
+        self._cell_name = as_output(cell_name)
+        self._resource_group_name = as_output(resource_group_name)
+        self._resource_group_id = as_output(resource_group_id)
         self._storage_account = storage_account
-        self._oidc_issuer_url = pulumi.Output.from_input(oidc_issuer_url)
-        self._tenant_id = pulumi.Output.from_input(tenant_id)
+        self._oidc_issuer_url = as_output(oidc_issuer_url)
+        self._tenant_id = as_output(tenant_id)
         self._operator_namespace = operator_namespace
         child_opts = pulumi.ResourceOptions(parent=self)
 
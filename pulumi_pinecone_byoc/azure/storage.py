@@ -5,6 +5,7 @@ import pulumi_azure_native as azure_native
 
 from config.azure import AzureConfig
 
+from ..common.naming import as_output
 from .naming import storage_account_name
 
 CONTAINER_TYPES = ["data", "wal", "index-backups", "janitor", "internal"]
@@ -22,8 +23,8 @@ class BlobStorage(pulumi.ComponentResource):
         super().__init__("pinecone:byoc:BlobStorage", name, None, opts)
 
         self.config = config
-        self._cell_name = pulumi.Output.from_input(cell_name)
-        self._resource_group_name = pulumi.Output.from_input(resource_group_name)
+        self._cell_name = as_output(cell_name)
+        self._resource_group_name = as_output(resource_group_name)
         child_opts = pulumi.ResourceOptions(parent=self)
 
         account_name = self._cell_name.apply(lambda cn: storage_account_name("pc", cn))
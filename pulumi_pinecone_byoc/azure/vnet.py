@@ -7,6 +7,8 @@ from pulumi_azure_native import network, resources
 
 from config.azure import AzureConfig
 
+from ..common.naming import as_output
+
 
 class VNet(pulumi.ComponentResource):
     def __init__(
@@ -19,7 +21,7 @@ class VNet(pulumi.ComponentResource):
         super().__init__("pinecone:byoc:VNet", name, None, opts)
 
         self.config = config
-        self._cell_name = pulumi.Output.from_input(cell_name)
+        self._cell_name = as_output(cell_name)
         child_opts = pulumi.ResourceOptions(parent=self)
 
         self.resource_group = resources.ResourceGroup(
@@ -12,7 +12,7 @@ from .api import (
 from .cred_refresher import RegistryCredentialRefresher
 from .k8s_configmaps import K8sConfigMaps
 from .k8s_secrets import K8sSecrets
-from .naming import DNS_CNAMES, cell_name
+from .naming import DNS_CNAME_SLUGS, DNS_CNAMES, cell_name
 from .pinetools import Pinetools
 from .providers import (
     AmpAccess,
@@ -59,6 +59,7 @@ __all__ = [
     "K8sSecrets",
     "cell_name",
     "DNS_CNAMES",
+    "DNS_CNAME_SLUGS",
     "RegistryCredentialRefresher",
     "Pinetools",
     "ClusterUninstaller",
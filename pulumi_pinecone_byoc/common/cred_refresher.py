@@ -5,6 +5,9 @@ import pulumi_kubernetes as k8s
 
 EXTRA_NAMESPACES = "prometheus metering tooling gloo-system kube-system"
 
+# reuse a cached token until it is this close to expiry
+TOKEN_REFRESH_MARGIN_SECONDS = 2 * 60 * 60
+
 REGISTRY_CONFIG = {
     "ecr": {
         "username": "AWS",
@@ -21,7 +24,7 @@ REGISTRY_CONFIG = {
 }
 
 
-def _build_refresher_script(registry: str) -> str:
+def _build_refresher_script(registry: str, namespace: str) -> str:
     cfg = REGISTRY_CONFIG[registry]
     username = cfg["username"]
     password_extraction = cfg["password_extraction"]
@@ -31,34 +34,121 @@ set -e
 echo "=== Registry Credential Refresher ({registry}) ==="
 echo "Time: $(date -Iseconds)"
 
-# 1. Get token from cpgw
-echo "Fetching {registry} token from cpgw..."
-RESPONSE=$(wget -qO- --header="Content-Type: application/json" \
-  --header="api-key: ${{CPGW_API_KEY}}" \
-  "${{CPGW_URL}}/internal/cpgw/infra/cr-token?registry={registry}")
+CACHE_SECRET="{registry}-token-cache"
+CACHE_NAMESPACE="{namespace}"
 
-# parse json without jq - extract values between quotes after key
-extract_json() {{
-  echo "$1" | grep -o "\"$2\":\"[^\"]*\"" | cut -d'"' -f4
+read_cache() {{
+  kubectl get secret "$CACHE_SECRET" -n "$CACHE_NAMESPACE" \
+    -o jsonpath="{{.data.$1}}" 2>/dev/null | base64 -d 2>/dev/null || true
 }}
 
-TOKEN_B64=$(extract_json "$RESPONSE" "token")
-REGISTRY=$(extract_json "$RESPONSE" "registry_endpoint")
-EXPIRES=$(extract_json "$RESPONSE" "expires_at")
-[ -z "$EXPIRES" ] && EXPIRES="unknown"
+# busybox date may not parse ISO 8601 with T/Z/fractional seconds, so retry without them
+to_epoch() {{
+  date -u -d "$1" +%s 2>/dev/null \
+    || date -u -d "$(echo "$1" | sed -e 's/T/ /' -e 's/\.[0-9]*//' -e 's/Z$//')" +%s 2>/dev/null \
+    || echo 0
+}}
 
-if [ -z "$TOKEN_B64" ]; then
-  echo "ERROR: Failed to get token"
-  echo "Response: $RESPONSE"
-  exit 1
+# Ask the registry whether $PASSWORD is still accepted, following its v2 auth challenge.
+# Credentials go through a netrc file so they never appear on a command line.
+token_accepted() {{
+  local host url challenge realm service netrc code
+  host=${{REGISTRY#https://}}
+  host=${{host%%/*}}
+  url="https://$host/v2/"
+  challenge=$(curl -s -o /dev/null -D - "$url" | tr -d '\r' | grep -i '^www-authenticate:' || true)
+  case "$challenge" in
+    *[Bb]earer*)
+      realm=$(echo "$challenge" | sed -n 's/.*realm="\([^"]*\)".*/\1/p')
+      service=$(echo "$challenge" | sed -n 's/.*service="\([^"]*\)".*/\1/p')
+      url="$realm?service=$service"
+      ;;
+  esac
+  netrc=$(mktemp)
+  printf 'machine %s login %s password %s\n' \
+    "$(echo "$url" | sed -e 's|^https://||' -e 's|/.*||')" "{username}" "$PASSWORD" > "$netrc"
+  code=$(curl -s -o /dev/null -w '%{{http_code}}' --netrc-file "$netrc" "$url" || true)
+  rm -f "$netrc"
+  [ "$code" = "200" ]
+}}
+
+# 1. Reuse the cached token unless it is close to expiry or the registry rejects it
+PASSWORD=""
+REGISTRY=""
+EXPIRES_AT=$(read_cache expires_at)
+case "$EXPIRES_AT" in
+  '')
+    echo "No cached token"
+    EXPIRES_AT=0
+    ;;
+  0|*[!0-9]*)
+    echo "WARNING: Cached token has no readable expiry, fetching a new one"
+    EXPIRES_AT=0
+    ;;
+esac
+
+if [ "$EXPIRES_AT" -gt "$(($(date +%s) + {TOKEN_REFRESH_MARGIN_SECONDS}))" ]; then
+  PASSWORD=$(read_cache password)
+  REGISTRY=$(read_cache registry)
+  if [ -n "$PASSWORD" ] && [ -n "$REGISTRY" ] && ! token_accepted; then
+    echo "WARNING: Registry rejected the cached token, fetching a new one"
+    PASSWORD=""
+  fi
 fi
 
-# Extract password from token
-PASSWORD=$({password_extraction})
+if [ -n "$PASSWORD" ] && [ -n "$REGISTRY" ]; then
+  echo "Using cached token for registry: $REGISTRY (expires_at: $EXPIRES_AT)"
+else
+  # 2. Get token from cpgw
+  echo "Fetching {registry} token from cpgw..."
+  RESPONSE=$(wget -qO- --header="Content-Type: application/json" \
+    --header="api-key: ${{CPGW_API_KEY}}" \
+    "${{CPGW_URL}}/internal/cpgw/infra/cr-token?registry={registry}")
+
+  # parse json without jq - extract values between quotes after key
+  extract_json() {{
+    echo "$1" | grep -o "\"$2\":\"[^\"]*\"" | cut -d'"' -f4
+  }}
+
+  TOKEN_B64=$(extract_json "$RESPONSE" "token")
+  REGISTRY=$(extract_json "$RESPONSE" "registry_endpoint")
+  EXPIRES=$(extract_json "$RESPONSE" "expires_at")
+  [ -z "$EXPIRES" ] && EXPIRES="unknown"
+
+  if [ -z "$TOKEN_B64" ]; then
+    echo "ERROR: Failed to get token"
+    echo "Response: $RESPONSE"
+    exit 1
+  fi
+
+  # Extract password from token
+  PASSWORD=$({password_extraction})
+
+  echo "Got token for registry: $REGISTRY (expires: $EXPIRES)"
 
-echo "Got token for registry: $REGISTRY (expires: $EXPIRES)"
+  EXPIRES_AT=0
+  if [ "$EXPIRES" != "unknown" ]; then
+    EXPIRES_AT=$(to_epoch "$EXPIRES")
+    if [ "$EXPIRES_AT" -eq 0 ]; then
+      echo "WARNING: Could not parse token expiry '$EXPIRES', it will not be reused"
+    fi
+  fi
 
-# 2. Discover all pc-* namespaces
+  # Cache the token through files so it never appears on a command line
+  CACHE_DIR=$(mktemp -d)
+  printf '%s' "$PASSWORD" > "$CACHE_DIR/password"
+  printf '%s' "$REGISTRY" > "$CACHE_DIR/registry"
+  printf '%s' "$EXPIRES_AT" > "$CACHE_DIR/expires_at"
+  if ! kubectl create secret generic "$CACHE_SECRET" -n "$CACHE_NAMESPACE" \
+    --from-file="$CACHE_DIR" --dry-run=client -o yaml \
+    | kubectl apply --server-side --force-conflicts --field-manager=cred-refresher -f - \
+    &>/dev/null; then
+    echo "WARNING: Failed to cache token"
+  fi
+  rm -rf "$CACHE_DIR"
+fi
+
+# 3. Discover all pc-* namespaces
 echo "Discovering namespaces..."
 PC_NAMESPACES=$(kubectl get namespaces -o jsonpath='{{.items[*].metadata.name}}' | tr ' ' '\n' | grep '^pc-' || true)
 
@@ -68,10 +158,16 @@ ALL_NAMESPACES=$(echo -e "${{PC_NAMESPACES}}\n$(echo $EXTRA_NAMESPACES | tr ' '
 echo "Target namespaces:"
 echo "$ALL_NAMESPACES" | sed 's/^/  - /'
 
-# 3. Distribute secret to all namespaces
+# 4. Distribute secret to all namespaces
 SUCCESS_COUNT=0
 FAIL_COUNT=0
 
+# Build the docker config in a file so the password never appears on a command line
+CRED_DIR=$(mktemp -d)
+AUTH=$(printf '%s:%s' "{username}" "$PASSWORD" | base64 | tr -d '\n')
+printf '{{"auths":{{"%s":{{"username":"%s","password":"%s","auth":"%s"}}}}}}' \
+  "$REGISTRY" "{username}" "$PASSWORD" "$AUTH" > "$CRED_DIR/.dockerconfigjson"
+
 for NS in $ALL_NAMESPACES; do
   # Check if namespace exists
   if ! kubectl get namespace "$NS" &>/dev/null; then
@@ -81,15 +177,13 @@ for NS in $ALL_NAMESPACES; do
 
   echo "  [$NS] Updating regcred..."
 
-  # Delete existing secret if present
-  kubectl delete secret regcred -n "$NS" --ignore-not-found &>/dev/null
-
-  # Create new secret
-  if kubectl create secret docker-registry regcred \
+  if kubectl create secret generic regcred \
     --namespace="$NS" \
-    --docker-server="$REGISTRY" \
-    --docker-username={username} \
-    --docker-password="$PASSWORD" &>/dev/null; then
+    --type=kubernetes.io/dockerconfigjson \
+    --from-file=.dockerconfigjson="$CRED_DIR/.dockerconfigjson" \
+    --dry-run=client -o yaml \
+    | kubectl apply --server-side --force-conflicts --field-manager=cred-refresher -f - \
+    &>/dev/null; then
     echo "  [$NS] Success"
     SUCCESS_COUNT=$((SUCCESS_COUNT + 1))
   else
@@ -98,6 +192,8 @@ for NS in $ALL_NAMESPACES; do
   fi
 done
 
+rm -rf "$CRED_DIR"
+
 echo ""
 echo "=== Summary ==="
 echo "Successful: $SUCCESS_COUNT"
@@ -127,6 +223,7 @@ class RegistryCredentialRefresher(pulumi.ComponentResource):
         )
 
         namespace = "external-secrets"
+        child_opts = pulumi.ResourceOptions(parent=self, provider=k8s_provider)
 
         cluster_role = k8s.rbac.v1.ClusterRole(
             f"{name}-cluster-role",
@@ -137,7 +234,7 @@ class RegistryCredentialRefresher(pulumi.ComponentResource):
                 k8s.rbac.v1.PolicyRuleArgs(
                     api_groups=[""],
                     resources=["secrets"],
-                    verbs=["create", "delete", "patch", "update", "get"],
+                    verbs=["create", "patch", "get"],
                 ),
                 k8s.rbac.v1.PolicyRuleArgs(
                     api_groups=[""],
@@ -145,7 +242,7 @@ class RegistryCredentialRefresher(pulumi.ComponentResource):
                     verbs=["list", "get"],
                 ),
             ],
-            opts=pulumi.ResourceOptions(parent=self, provider=k8s_provider),
+            opts=child_opts,
         )
 
         service_account = k8s.core.v1.ServiceAccount(
@@ -154,7 +251,7 @@ class RegistryCredentialRefresher(pulumi.ComponentResource):
                 name=f"{registry}-credential-refresher",
                 namespace=namespace,
             ),
-            opts=pulumi.ResourceOptions(parent=self, provider=k8s_provider),
+            opts=child_opts,
         )
 
         cluster_role_binding = k8s.rbac.v1.ClusterRoleBinding(
@@ -174,8 +271,20 @@ class RegistryCredentialRefresher(pulumi.ComponentResource):
                 name=f"{registry}-credential-refresher",
                 api_group="rbac.authorization.k8s.io",
             ),
-            opts=pulumi.ResourceOptions(
-                parent=self, provider=k8s_provider, depends_on=[cluster_role]
+            opts=pulumi.ResourceOptions.merge(
+                child_opts, pulumi.ResourceOptions(depends_on=[cluster_role])
+            ),
+        )
+
+        k8s.core.v1.Secret(
+            f"{name}-token-cache",
+            metadata=k8s.meta.v1.ObjectMetaArgs(
+                name=f"{registry}-token-cache",
+                namespace=namespace,
+            ),
+            type="Opaque",
+            opts=pulumi.ResourceOptions.merge(
+                child_opts, pulumi.ResourceOptions(ignore_changes=["data"])
             ),
         )
 
@@ -188,7 +297,7 @@ class RegistryCredentialRefresher(pulumi.ComponentResource):
             data={
                 "cpgw-url": cpgw_url,
             },
-            opts=pulumi.ResourceOptions(parent=self, provider=k8s_provider),
+            opts=child_opts,
         )
 
         cronjob = k8s.batch.v1.CronJob(
@@ -239,7 +348,7 @@ class RegistryCredentialRefresher(pulumi.ComponentResource):
                                             ),
                                         ],
                                         command=["/bin/bash", "-c"],
-                                        args=[_build_refresher_script(registry)],
+                                        args=[_build_refresher_script(registry, namespace)],
                                     ),
                                 ],
                             ),
@@ -247,14 +356,15 @@ class RegistryCredentialRefresher(pulumi.ComponentResource):
                     ),
                 ),
             ),
-            opts=pulumi.ResourceOptions(
-                parent=self,
-                provider=k8s_provider,
-                depends_on=[
-                    service_account,
-                    cluster_role_binding,
-                    config_map,
-                ],
+            opts=pulumi.ResourceOptions.merge(
+                child_opts,
+                pulumi.ResourceOptions(
+                    depends_on=[
+                        service_account,
+                        cluster_role_binding,
+                        config_map,
+                    ]
+                ),
             ),
         )
 
@@ -10,6 +10,8 @@ ORG_NAME_MAX_LENGTH = 16
 
 # CNAME records created in both DNS and NLB components across all clouds
 DNS_CNAMES = ["*.svc", "metrics", "prometheus"]
+# (record prefix, resource-name-safe slug), e.g. ("*.svc", "wildcard-svc")
+DNS_CNAME_SLUGS = [(c, c.replace("*.", "wildcard-").replace(".", "-")) for c in DNS_CNAMES]
 
 
 def cell_name(environment: Environment) -> pulumi.Output[str]:
@@ -21,3 +23,8 @@ def cell_name(environment: Environment) -> pulumi.Output[str]:
     return pulumi.Output.all(environment.org_name, environment.env_name).apply(
         lambda args: f"{sanitize(args[0])}-byoc-{args[1].split('.')[0][-4:]}"
     )
+
+
+def as_output[T](value: pulumi.Input[T]) -> pulumi.Output[T]:
+    """Return value as an Output, passing an existing Output through unwrapped."""
+    return value if isinstance(value, pulumi.Output) else pulumi.Output.from_input(value)
@@ -2,15 +2,36 @@
 GCP components for Pinecone BYOC clusters.
 """
 
-from .alloydb import AlloyDB, AlloyDBInstance
-from .cluster import NodePool, PineconeGCPCluster, PineconeGCPClusterArgs
-from .dns import DNS
-from .gcs import GCSBuckets
-from .gke import GKE
-from .k8s_addons import K8sAddons
-from .nlb import InternalLoadBalancer
-from .pulumi_operator import PulumiOperator
-from .vpc import VPC
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .alloydb import AlloyDB, AlloyDBInstance
+    from .cluster import NodePool, PineconeGCPCluster, PineconeGCPClusterArgs
+    from .dns import DNS
+    from .gcs import GCSBuckets
+    from .gke import GKE
+    from .k8s_addons import K8sAddons
+    from .nlb import InternalLoadBalancer
+    from .pulumi_operator import PulumiOperator
+    from .vpc import VPC
+
+# submodules pull in pulumi_gcp and pulumi_kubernetes, so load them on first access;
+# this package facade is the one exception to keeping imports at module level
+_LAZY = {
+    "PineconeGCPCluster": ".cluster",
+    "PineconeGCPClusterArgs": ".cluster",
+    "NodePool": ".cluster",
+    "VPC": ".vpc",
+    "GKE": ".gke",
+    "GCSBuckets": ".gcs",
+    "DNS": ".dns",
+    "InternalLoadBalancer": ".nlb",
+    "AlloyDB": ".alloydb",
+    "AlloyDBInstance": ".alloydb",
+    "K8sAddons": ".k8s_addons",
+    "PulumiOperator": ".pulumi_operator",
+}
 
 __all__ = [
     "PineconeGCPCluster",
@@ -26,3 +47,15 @@ __all__ = [
     "K8sAddons",
     "PulumiOperator",
 ]
+
+
+def __getattr__(name: str) -> object:
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    obj = getattr(importlib.import_module(_LAZY[name], __name__), name)
+    globals()[name] = obj
+    return obj
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -1,11 +1,21 @@
 """AlloyDB cluster infrastructure for PostgreSQL databases."""
 
+import json
+from functools import cached_property
+from urllib.parse import quote
+
 import pulumi
 import pulumi_gcp as gcp
 import pulumi_random as random
 
 from config.gcp import GCPConfig
 
+from ..common.naming import as_output
+
+# (minimum cpu_count, max_connections), largest tier first
+MAX_CONNECTIONS_BY_CPU = ((8, 4000), (4, 2000))
+DEFAULT_MAX_CONNECTIONS = 1000
+
 
 class _AlloyDBClusterCompat:
     """Mimics RDS cluster interface for K8sSecrets compatibility."""
@@ -21,7 +31,7 @@ class _AlloyDBClusterCompat:
     def reader_endpoint(self) -> pulumi.Output[str]:
         return self._instance.ip_address
 
-    @property
+    @cached_property
     def port(self) -> pulumi.Output[int]:
         return pulumi.Output.from_input(5432)
 
@@ -60,11 +70,14 @@ class AlloyDBInstance:
     def port(self) -> int:
         return 5432
 
-    @property
+    @cached_property
     def connection_string(self) -> pulumi.Output[str]:
-        return pulumi.Output.all(
-            self.instance.ip_address, self.username, self.password.result, self.db_name
-        ).apply(lambda args: f"postgresql://{args[1]}:{args[2]}@{args[0]}:5432/{args[3]}")
+        return pulumi.Output.all(self.instance.ip_address, self.password.result).apply(
+            lambda args: (
+                f"postgresql://{self.username}:{quote(args[1], safe='')}"
+                f"@{args[0]}:5432/{self.db_name}"
+            )
+        )
 
 
 class AlloyDB(pulumi.ComponentResource):
@@ -80,7 +93,10 @@ class AlloyDB(pulumi.ComponentResource):
     ):
         super().__init__("pinecone:byoc:AlloyDB", name, None, opts)
 
-        self._cell_name = pulumi.Output.from_input(cell_name)
+        self._cell_name = as_output(cell_name)
+        self._labels = config.labels()
+
+        cluster_opts = pulumi.ResourceOptions(parent=self, depends_on=[private_connection])
 
         self._control_db = self._create_alloydb_cluster(
             name=f"{name}-control-db",
@@ -88,7 +104,7 @@ class AlloyDB(pulumi.ComponentResource):
             config=config,
             network_id=network_id,
             private_ip_range_name=private_ip_range_name,
-            private_connection=private_connection,
+            cluster_opts=cluster_opts,
         )
 
         self._system_db = self._create_alloydb_cluster(
@@ -97,7 +113,7 @@ class AlloyDB(pulumi.ComponentResource):
             config=config,
             network_id=network_id,
             private_ip_range_name=private_ip_range_name,
-            private_connection=private_connection,
+            cluster_opts=cluster_opts,
         )
 
         self.register_outputs(
@@ -114,15 +130,16 @@ class AlloyDB(pulumi.ComponentResource):
         config: GCPConfig,
         network_id: pulumi.Output[str],
         private_ip_range_name: pulumi.Output[str],
-        private_connection: gcp.servicenetworking.Connection,
+        cluster_opts: pulumi.ResourceOptions,
     ) -> AlloyDBInstance:
         cluster_id = self._cell_name.apply(lambda cn: f"{db_config.name}-{cn}")
+        child_opts = pulumi.ResourceOptions(parent=self)
 
         password = random.RandomPassword(
             f"{name}-password",
             length=32,
             special=False,
-            opts=pulumi.ResourceOptions(parent=self),
+            opts=child_opts,
         )
 
         cluster = gcp.alloydb.Cluster(
@@ -139,40 +156,44 @@ class AlloyDB(pulumi.ComponentResource):
                 password=password.result,
             ),
             deletion_policy="FORCE" if not config.database.deletion_protection else "DEFAULT",
-            labels=config.labels(),
-            opts=pulumi.ResourceOptions(parent=self, depends_on=[private_connection]),
+            labels=self._labels,
+            opts=cluster_opts,
         )
 
-        instance_id = self._cell_name.apply(lambda cn: f"{db_config.name}-{cn}-instance")
+        max_connections = str(self._calculate_max_connections(db_config.cpu_count))
         instance = gcp.alloydb.Instance(
             f"{name}-instance",
-            instance_id=instance_id,
+            instance_id=pulumi.Output.concat(cluster_id, "-instance"),
             instance_type="PRIMARY",
             cluster=cluster.name,
             machine_config=gcp.alloydb.InstanceMachineConfigArgs(cpu_count=db_config.cpu_count),
             availability_type="REGIONAL" if config.database.deletion_protection else "ZONAL",
-            labels=config.labels(),
-            database_flags={
-                "max_connections": str(self._calculate_max_connections(db_config.cpu_count)),
-            },
-            opts=pulumi.ResourceOptions(parent=self, depends_on=[cluster]),
+            labels=self._labels,
+            database_flags={"max_connections": max_connections},
+            opts=child_opts,
         )
 
-        secret_id = self._cell_name.apply(lambda cn: f"{db_config.name}-{cn}-credentials")
         secret = gcp.secretmanager.Secret(
             f"{name}-secret",
-            secret_id=secret_id,
+            secret_id=pulumi.Output.concat(cluster_id, "-credentials"),
             replication=gcp.secretmanager.SecretReplicationArgs(
                 auto=gcp.secretmanager.SecretReplicationAutoArgs()
             ),
-            opts=pulumi.ResourceOptions(parent=self),
+            opts=child_opts,
         )
 
         secret_value = pulumi.Output.all(
-            instance.ip_address, db_config.username, password.result, db_config.db_name
+            host=instance.ip_address,
+            password=password.result,
         ).apply(
-            lambda args: (
-                f'{{"host": "{args[0]}", "port": 5432, "username": "{args[1]}", "password": "{args[2]}", "database": "{args[3]}"}}'
+            lambda args: json.dumps(
+                {
+                    "host": args["host"],
+                    "port": 5432,
+                    "username": db_config.username,
+                    "password": args["password"],
+                    "database": db_config.db_name,
+                }
             )
         )
 
@@ -180,7 +201,7 @@ class AlloyDB(pulumi.ComponentResource):
             f"{name}-secret-version",
             secret=secret.id,
             secret_data=secret_value,
-            opts=pulumi.ResourceOptions(parent=self, depends_on=[secret]),
+            opts=child_opts,
         )
 
         return AlloyDBInstance(
@@ -192,11 +213,10 @@ class AlloyDB(pulumi.ComponentResource):
         )
 
     def _calculate_max_connections(self, cpu_count: int) -> int:
-        if cpu_count >= 8:
-            return 4000
-        if cpu_count >= 4:
-            return 2000
-        return 1000
+        return next(
+            (conns for min_cpu, conns in MAX_CONNECTIONS_BY_CPU if cpu_count >= min_cpu),
+            DEFAULT_MAX_CONNECTIONS,
+        )
 
     @property
     def control_db(self) -> AlloyDBInstance:
@@ -36,7 +36,7 @@ from .pulumi_operator import PulumiOperator
 from .vpc import VPC
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class NodePool:
     name: str
     machine_type: str = "n2-standard-4"
@@ -47,7 +47,7 @@ class NodePool:
     taints: list = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class PineconeGCPClusterArgs:
     # required
     pinecone_api_key: pulumi.Input[str]
@@ -122,9 +122,6 @@ class PineconeGCPCluster(pulumi.ComponentResource):
 
         self._cell_name = _cell_name(self._environment)
 
-        # resource_suffix for unique GCP resource names (last 4 chars of cell_name)
-        self._resource_suffix = self._cell_name.apply(lambda cn: cn[-4:])
-
         self._cpgw_api_key = CpgwApiKey(
             f"{config.resource_prefix}-cpgw-api-key",
             CpgwApiKeyArgs(
@@ -132,7 +129,7 @@ class PineconeGCPCluster(pulumi.ComponentResource):
                 api_url=args.api_url,
                 pinecone_api_key=args.pinecone_api_key,
             ),
-            opts=pulumi.ResourceOptions(parent=self, depends_on=[self._environment]),
+            opts=self._child_opts(self._environment),
         )
 
         self._service_account = ServiceAccount(
@@ -142,7 +139,7 @@ class PineconeGCPCluster(pulumi.ComponentResource):
                 api_url=args.api_url,
                 secret=self._cpgw_api_key.key,
             ),
-            opts=pulumi.ResourceOptions(parent=self, depends_on=[self._cpgw_api_key]),
+            opts=self._child_opts(self._cpgw_api_key),
         )
 
         self._api_key = ApiKey(
@@ -156,7 +153,7 @@ class PineconeGCPCluster(pulumi.ComponentResource):
                 auth0_client_id=self._service_account.client_id,
                 auth0_client_secret=self._service_account.client_secret,
             ),
-            opts=pulumi.ResourceOptions(parent=self, depends_on=[self._service_account]),
+            opts=self._child_opts(self._service_account),
         )
 
         self._datadog_api_key = DatadogApiKey(
@@ -165,7 +162,7 @@ class PineconeGCPCluster(pulumi.ComponentResource):
                 api_url=args.api_url,
                 cpgw_api_key=self._cpgw_api_key.key,
             ),
-            opts=pulumi.ResourceOptions(parent=self, depends_on=[self._cpgw_api_key]),
+            opts=self._child_opts(self._cpgw_api_key),
         )
 
         self._vpc = VPC(
@@ -181,7 +178,7 @@ class PineconeGCPCluster(pulumi.ComponentResource):
             self._vpc.network_id,
             self._vpc.main_subnet_id,
             self._cell_name,
-            opts=pulumi.ResourceOptions(parent=self, depends_on=[self._vpc]),
+            opts=self._child_opts(self._vpc),
         )
 
         self._gcs = GCSBuckets(
@@ -189,7 +186,7 @@ class PineconeGCPCluster(pulumi.ComponentResource):
             config,
             self._cell_name,
             force_destroy=not args.deletion_protection,
-            opts=pulumi.ResourceOptions(parent=self, depends_on=[self._gke]),
+            opts=self._child_opts(self._gke),
         )
 
         self._alloydb = AlloyDB(
@@ -199,25 +196,26 @@ class PineconeGCPCluster(pulumi.ComponentResource):
             self._vpc.private_ip_range_name,
             self._vpc.private_connection,
             self._cell_name,
-            opts=pulumi.ResourceOptions(parent=self, depends_on=[self._vpc]),
+            opts=self._child_opts(self._vpc),
         )
 
         self._subdomain = self._environment.env_name
+        dns_subdomain = self._subdomain.apply(lambda name: name.removesuffix(".byoc"))
 
         self._dns = DNS(
             f"{config.resource_prefix}-dns",
-            subdomain=self._subdomain.apply(lambda name: name.removesuffix(".byoc")),
+            subdomain=dns_subdomain,
             parent_zone_name=args.parent_dns_zone_name,
             api_url=args.api_url,
             cpgw_api_key=self._cpgw_api_key.key,
             cell_name=self._cell_name,
-            opts=pulumi.ResourceOptions(parent=self, depends_on=[self._cpgw_api_key]),
+            opts=self._child_opts(self._cpgw_api_key),
         )
 
         self._k8s_addons = K8sAddons(
             f"{config.resource_prefix}-k8s-addons",
             self._gke,
-            opts=pulumi.ResourceOptions(parent=self, depends_on=[self._gke]),
+            opts=self._child_opts(self._gke),
         )
 
         self._nlb = InternalLoadBalancer(
@@ -229,10 +227,7 @@ class PineconeGCPCluster(pulumi.ComponentResource):
             self._dns.subdomain,
             self._cell_name,
             args.public_access_enabled,
-            opts=pulumi.ResourceOptions(
-                parent=self,
-                depends_on=[self._vpc, self._dns, self._gke, self._k8s_addons],
-            ),
+            opts=self._child_opts(self._vpc, self._dns, self._gke, self._k8s_addons),
         )
 
         self._k8s_secrets = K8sSecrets(
@@ -248,15 +243,8 @@ class PineconeGCPCluster(pulumi.ComponentResource):
                 if self._gke.service_accounts.storage_integration_key_json is not None
                 else None
             ),
-            opts=pulumi.ResourceOptions(
-                parent=self,
-                depends_on=[
-                    self._gke,
-                    self._cpgw_api_key,
-                    self._api_key,
-                    self._datadog_api_key,
-                    self._alloydb,
-                ],
+            opts=self._child_opts(
+                self._gke, self._cpgw_api_key, self._api_key, self._datadog_api_key, self._alloydb
             ),
         )
 
@@ -266,7 +254,7 @@ class PineconeGCPCluster(pulumi.ComponentResource):
             self._gke.k8s_provider,
             self._gke.service_accounts.pulumi_sa.email,
             self._cell_name,
-            opts=pulumi.ResourceOptions(parent=self, depends_on=[self._gke]),
+            opts=self._child_opts(self._gke),
         )
 
         self._amp_access = AmpAccess(
@@ -276,7 +264,7 @@ class PineconeGCPCluster(pulumi.ComponentResource):
                 api_url=args.api_url,
                 cpgw_api_key=self._cpgw_api_key.key,
             ),
-            opts=pulumi.ResourceOptions(parent=self, depends_on=[self._cpgw_api_key]),
+            opts=self._child_opts(self._cpgw_api_key),
         )
 
         pulumi_outputs = {
@@ -293,7 +281,7 @@ class PineconeGCPCluster(pulumi.ComponentResource):
             "gcp_project": config.project,
             "image_registry": GCP_REGISTRY.base_url,
             "sli_checkers_project_id": self._api_key.project_id,
-            "customer_tags": args.labels or {},
+            "customer_tags": config.custom_tags,
             "public_access_enabled": args.public_access_enabled,
             "pulumi_backend_url": self._pulumi_operator.backend_url,
             "pulumi_secrets_provider": self._pulumi_operator.secrets_provider,
@@ -322,10 +310,7 @@ class PineconeGCPCluster(pulumi.ComponentResource):
             region=config.region,
             public_access_enabled=args.public_access_enabled,
             pulumi_outputs=pulumi_outputs,
-            opts=pulumi.ResourceOptions(
-                parent=self,
-                depends_on=[self._gke, self._dns, self._gcs, self._alloydb],
-            ),
+            opts=self._child_opts(self._gke, self._dns, self._gcs, self._alloydb),
         )
 
         self._gcr_refresher = RegistryCredentialRefresher(
@@ -333,7 +318,7 @@ class PineconeGCPCluster(pulumi.ComponentResource):
             k8s_provider=self._gke.k8s_provider,
             cpgw_url=args.api_url,
             registry=GCP_REGISTRY.type,
-            opts=pulumi.ResourceOptions(parent=self, depends_on=[self._k8s_secrets]),
+            opts=self._child_opts(self._k8s_secrets),
         )
 
         self._pinetools = Pinetools(
@@ -341,7 +326,7 @@ class PineconeGCPCluster(pulumi.ComponentResource):
             k8s_provider=self._gke.k8s_provider,
             pinecone_version=args.pinecone_version,
             pinetools_image=GCP_REGISTRY.pinetools_image(args.pinecone_version),
-            opts=pulumi.ResourceOptions(parent=self, depends_on=[self._gke, self._k8s_configmaps]),
+            opts=self._child_opts(self._gke, self._k8s_configmaps),
         )
 
         self._uninstaller = ClusterUninstaller(
@@ -349,19 +334,16 @@ class PineconeGCPCluster(pulumi.ComponentResource):
             kubeconfig=self._gke.kubeconfig,
             pinetools_image=GCP_REGISTRY.pinetools_image(args.pinecone_version),
             cloud="gcp",
-            opts=pulumi.ResourceOptions(
-                parent=self,
-                depends_on=[
-                    self._pinetools.ns,
-                    self._pinetools.sa,
-                    self._pinetools.crb,
-                    self._k8s_addons,
-                    self._k8s_secrets,
-                    self._k8s_configmaps,
-                    self._gcr_refresher,
-                    self._nlb,
-                    self._pulumi_operator,
-                ],
+            opts=self._child_opts(
+                self._pinetools.ns,
+                self._pinetools.sa,
+                self._pinetools.crb,
+                self._k8s_addons,
+                self._k8s_secrets,
+                self._k8s_configmaps,
+                self._gcr_refresher,
+                self._nlb,
+                self._pulumi_operator,
             ),
         )
 
@@ -394,25 +376,27 @@ class PineconeGCPCluster(pulumi.ComponentResource):
             }
         )
 
+    def _child_opts(self, *depends_on: pulumi.Resource) -> pulumi.ResourceOptions:
+        return pulumi.ResourceOptions(parent=self, depends_on=list(depends_on))
+
     def _build_config(self, args: PineconeGCPClusterArgs):
         # lazy import to avoid circular dependency: config imports are deferred
         from config.base import NodePoolConfig
         from config.gcp import AlloyDBConfig, AlloyDBInstanceConfig, GCPConfig
 
-        node_pools = []
         if args.node_pools:
-            for np in args.node_pools:
-                node_pools.append(
-                    NodePoolConfig(
-                        name=np.name,
-                        machine_type=np.machine_type,
-                        min_size=np.min_size,
-                        max_size=np.max_size,
-                        disk_size_gb=np.disk_size_gb,
-                        labels=np.labels,
-                        taints=np.taints,
-                    )
+            node_pools = [
+                NodePoolConfig(
+                    name=np.name,
+                    machine_type=np.machine_type,
+                    min_size=np.min_size,
+                    max_size=np.max_size,
+                    disk_size_gb=np.disk_size_gb,
+                    labels=np.labels,
+                    taints=np.taints,
                 )
+                for np in args.node_pools
+            ]
         else:
             node_pools = [
                 NodePoolConfig(
@@ -3,7 +3,7 @@
 import pulumi
 import pulumi_gcp as gcp
 
-from ..common.naming import DNS_CNAMES
+from ..common.naming import DNS_CNAME_SLUGS, as_output
 from ..common.providers import DnsDelegation, DnsDelegationArgs
 
 
@@ -20,47 +20,46 @@ class DNS(pulumi.ComponentResource):
     ):
         super().__init__("pinecone:byoc:DNS", name, None, opts)
 
-        self._cell_name = pulumi.Output.from_input(cell_name)
+        self._cell_name = as_output(cell_name)
+        child_opts = pulumi.ResourceOptions(parent=self)
 
-        def build_fqdn(sub: str) -> str:
-            return f"{sub}.{parent_zone_name}"
-
-        fqdn = pulumi.Output.from_input(subdomain).apply(build_fqdn)
+        fqdn = pulumi.Output.concat(subdomain, ".", parent_zone_name)
+        ingress_target = fqdn.apply(lambda s: f"ingress.{s}.")
 
         external_ip = gcp.compute.GlobalAddress(
             f"{name}-external-ip",
-            name=self._cell_name.apply(lambda cn: f"externalip-{cn}"),
-            opts=pulumi.ResourceOptions(parent=self),
+            name=pulumi.Output.concat("externalip-", self._cell_name),
+            opts=child_opts,
         )
 
         dns_zone = gcp.dns.ManagedZone(
             f"{name}-zone",
-            name=self._cell_name.apply(lambda cn: f"dns-zone-{cn}"),
-            description=self._cell_name.apply(lambda cn: f"DNS zone for {cn}"),
+            name=pulumi.Output.concat("dns-zone-", self._cell_name),
+            description=pulumi.Output.concat("DNS zone for ", self._cell_name),
             dns_name=fqdn.apply(lambda s: f"{s}."),
-            opts=pulumi.ResourceOptions(parent=self),
+            opts=child_opts,
         )
 
         ingress_a_record = gcp.dns.RecordSet(
             f"{name}-ingress-a-record",
             managed_zone=dns_zone.name,
-            name=fqdn.apply(lambda s: f"ingress.{s}."),
+            name=ingress_target,
             type="A",
             rrdatas=[external_ip.address],
             ttl=300,
-            opts=pulumi.ResourceOptions(parent=self, depends_on=[dns_zone]),
+            opts=child_opts,
         )
 
         cname_records = []
-        for cname in DNS_CNAMES:
+        for cname, slug in DNS_CNAME_SLUGS:
             cname_record = gcp.dns.RecordSet(
-                f"{name}-{cname.replace('*.', 'wildcard-').replace('.', '-')}-cname",
+                f"{name}-{slug}-cname",
                 managed_zone=dns_zone.name,
                 name=fqdn.apply(lambda s, c=cname: f"{c}.{s}."),
                 type="CNAME",
                 ttl=300,
-                rrdatas=[fqdn.apply(lambda s: f"ingress.{s}.")],
-                opts=pulumi.ResourceOptions(parent=self, depends_on=[dns_zone]),
+                rrdatas=[ingress_target],
+                opts=child_opts,
             )
             cname_records.append(cname_record)
 
@@ -72,7 +71,9 @@ class DNS(pulumi.ComponentResource):
                 api_url=api_url,
                 cpgw_api_key=cpgw_api_key,
             ),
-            opts=pulumi.ResourceOptions(parent=self, depends_on=[dns_zone]),
+            opts=pulumi.ResourceOptions.merge(
+                child_opts, pulumi.ResourceOptions(depends_on=[dns_zone])
+            ),
         )
 
         self._dns_zone = dns_zone
@@ -5,6 +5,46 @@ import pulumi_gcp as gcp
 
 from config.gcp import GCPConfig
 
+from ..common.naming import as_output
+
+BUCKET_TYPES = ["data", "index-backups", "wal", "janitor", "internal"]
+
+BUCKET_LIFECYCLE_RULES = [
+    gcp.storage.BucketLifecycleRuleArgs(
+        action=gcp.storage.BucketLifecycleRuleActionArgs(
+            type="AbortIncompleteMultipartUpload",
+        ),
+        condition=gcp.storage.BucketLifecycleRuleConditionArgs(age=1),
+    ),
+    gcp.storage.BucketLifecycleRuleArgs(
+        action=gcp.storage.BucketLifecycleRuleActionArgs(type="Delete"),
+        condition=gcp.storage.BucketLifecycleRuleConditionArgs(
+            days_since_noncurrent_time=3,
+        ),
+    ),
+    gcp.storage.BucketLifecycleRuleArgs(
+        action=gcp.storage.BucketLifecycleRuleActionArgs(type="Delete"),
+        condition=gcp.storage.BucketLifecycleRuleConditionArgs(
+            age=30,
+            matches_prefixes=["activity-scrapes/"],
+        ),
+    ),
+    gcp.storage.BucketLifecycleRuleArgs(
+        action=gcp.storage.BucketLifecycleRuleActionArgs(type="Delete"),
+        condition=gcp.storage.BucketLifecycleRuleConditionArgs(
+            age=7,
+            matches_prefixes=["janitor/"],
+        ),
+    ),
+    gcp.storage.BucketLifecycleRuleArgs(
+        action=gcp.storage.BucketLifecycleRuleActionArgs(type="Delete"),
+        condition=gcp.storage.BucketLifecycleRuleConditionArgs(
+            age=14,
+            matches_prefixes=["lag-reporter/"],
+        ),
+    ),
+]
+
 
 class GCSBuckets(pulumi.ComponentResource):
     def __init__(
@@ -18,39 +58,25 @@ class GCSBuckets(pulumi.ComponentResource):
         super().__init__("pinecone:byoc:GCSBuckets", name, None, opts)
 
         self.config = config
-        self._cell_name = pulumi.Output.from_input(cell_name)
+        self._cell_name = as_output(cell_name)
         self._force_destroy = force_destroy
+        self._labels = config.labels()
         child_opts = pulumi.ResourceOptions(parent=self)
 
-        self.data_bucket = self._create_bucket(
-            name=f"{name}-data",
-            bucket_type="data",
-            opts=child_opts,
-        )
-
-        self.index_backups_bucket = self._create_bucket(
-            name=f"{name}-index-backups",
-            bucket_type="index-backups",
-            opts=child_opts,
-        )
-
-        self.wal_bucket = self._create_bucket(
-            name=f"{name}-wal",
-            bucket_type="wal",
-            opts=child_opts,
-        )
-
-        self.janitor_bucket = self._create_bucket(
-            name=f"{name}-janitor",
-            bucket_type="janitor",
-            opts=child_opts,
-        )
-
-        self.internal_bucket = self._create_bucket(
-            name=f"{name}-internal",
-            bucket_type="internal",
-            opts=child_opts,
-        )
+        # buckets: pc-{type}-{cell_name}
+        self.buckets: dict[str, gcp.storage.Bucket] = {}
+        for bucket_type in BUCKET_TYPES:
+            self.buckets[bucket_type] = self._create_bucket(
+                name=f"{name}-{bucket_type}",
+                bucket_type=bucket_type,
+                opts=child_opts,
+            )
+
+        self.data_bucket = self.buckets["data"]
+        self.index_backups_bucket = self.buckets["index-backups"]
+        self.wal_bucket = self.buckets["wal"]
+        self.janitor_bucket = self.buckets["janitor"]
+        self.internal_bucket = self.buckets["internal"]
 
         self.register_outputs(
             {
@@ -68,52 +94,16 @@ class GCSBuckets(pulumi.ComponentResource):
         bucket_type: str,
         opts: pulumi.ResourceOptions | None = None,
     ) -> gcp.storage.Bucket:
-        full_bucket_name = self._cell_name.apply(lambda cn: f"pc-{bucket_type}-{cn}")
-
         bucket = gcp.storage.Bucket(
             name,
-            name=full_bucket_name,
+            name=pulumi.Output.concat(f"pc-{bucket_type}-", self._cell_name),
             project=self.config.project,
             location=self.config.region,
             force_destroy=self._force_destroy,
             uniform_bucket_level_access=True,
             versioning=gcp.storage.BucketVersioningArgs(enabled=True),
-            lifecycle_rules=[
-                gcp.storage.BucketLifecycleRuleArgs(
-                    action=gcp.storage.BucketLifecycleRuleActionArgs(
-                        type="AbortIncompleteMultipartUpload",
-                    ),
-                    condition=gcp.storage.BucketLifecycleRuleConditionArgs(age=1),
-                ),
-                gcp.storage.BucketLifecycleRuleArgs(
-                    action=gcp.storage.BucketLifecycleRuleActionArgs(type="Delete"),
-                    condition=gcp.storage.BucketLifecycleRuleConditionArgs(
-                        days_since_noncurrent_time=3,
-                    ),
-                ),
-                gcp.storage.BucketLifecycleRuleArgs(
-                    action=gcp.storage.BucketLifecycleRuleActionArgs(type="Delete"),
-                    condition=gcp.storage.BucketLifecycleRuleConditionArgs(
-                        age=30,
-                        matches_prefixes=["activity-scrapes/"],
-                    ),
-                ),
-                gcp.storage.BucketLifecycleRuleArgs(
-                    action=gcp.storage.BucketLifecycleRuleActionArgs(type="Delete"),
-                    condition=gcp.storage.BucketLifecycleRuleConditionArgs(
-                        age=7,
-                        matches_prefixes=["janitor/"],
-                    ),
-                ),
-                gcp.storage.BucketLifecycleRuleArgs(
-                    action=gcp.storage.BucketLifecycleRuleActionArgs(type="Delete"),
-                    condition=gcp.storage.BucketLifecycleRuleConditionArgs(
-                        age=14,
-                        matches_prefixes=["lag-reporter/"],
-                    ),
-                ),
-            ],
-            labels=self.config.labels(),
+            lifecycle_rules=BUCKET_LIFECYCLE_RULES,
+            labels=self._labels,
             opts=opts,
         )
 
@@ -1,6 +1,8 @@
 """GKE cluster infrastructure with Workload Identity."""
 
 import base64
+from dataclasses import dataclass
+from functools import partial
 
 import pulumi
 import pulumi_gcp as gcp
@@ -9,52 +11,86 @@ import pulumi_kubernetes as k8s
 from config.base import NodePoolConfig
 from config.gcp import GCPConfig
 
+from ..common.naming import as_output
+
 _GCP_SA_MAX_LEN = 30
 
+# (account id prefix, resource name suffix, display name description)
+_SERVICE_ACCOUNT_SPECS = [
+    ("np", "np-sa", "Nodepool"),
+    ("read", "read-sa", "Reader"),
+    ("write", "write-sa", "Writer"),
+    ("dns", "dns-sa", "DNS"),
+    ("pulumi", "pulumi-sa", "Pulumi"),
+    ("si", "storage-integration-sa", "Storage integration"),
+]
+
+# (resource name suffix, service account prefix, project role)
+_PROJECT_IAM_ROLES = [
+    ("np-sa-iam", "np", "roles/iam.serviceAccountAdmin"),
+    ("np-sa-storage", "np", "roles/storage.admin"),
+    ("read-sa-storage", "read", "roles/storage.objectViewer"),
+    ("write-sa-storage", "write", "roles/storage.admin"),
+    ("write-sa-iam", "write", "roles/iam.serviceAccountAdmin"),
+    ("dns-sa", "dns", "roles/dns.admin"),
+    ("pulumi-sa-k8s", "pulumi", "roles/container.serviceAgent"),
+    ("storage-integration-sa-storage", "si", "roles/storage.objectViewer"),
+]
+
+_KUBECONFIG_TEMPLATE = """apiVersion: v1
+clusters:
+- cluster:
+    certificate-authority-data: {ca}
+    server: https://{endpoint}
+  name: {name}
+contexts:
+- context:
+    cluster: {name}
+    user: {name}
+  name: {name}
+current-context: {name}
+kind: Config
+preferences: {{}}
+users:
+- name: {name}
+  user:
+    exec:
+      apiVersion: client.authentication.k8s.io/v1beta1
+      command: gke-gcloud-auth-plugin
+      installHint: Install gke-gcloud-auth-plugin for use with kubectl
+      provideClusterInfo: true
+"""
+
 
 def _sa_id(prefix: str, cell_name: str) -> str:
     """Build a GCP service account ID that fits within 30 chars.
 
     Keeps the unique '-byoc-XXXX' suffix intact, truncates the org portion.
     """
-    suffix = cell_name[cell_name.rfind("-byoc-") :]  # "-byoc-82cb" (10 chars)
+    split = cell_name.rfind("-byoc-")
+    suffix = cell_name[split:]  # "-byoc-82cb" (10 chars)
     max_org = _GCP_SA_MAX_LEN - len(prefix) - 1 - len(suffix)  # -1 for separator
-    org = cell_name[: cell_name.rfind("-byoc-")][:max_org]
+    org = cell_name[:split][:max_org]
     return f"{prefix}-{org}{suffix}"
 
 
+@dataclass(slots=True)
 class ServiceAccounts:
-    def __init__(
-        self,
-        nodepool_sa: gcp.serviceaccount.Account,
-        reader_sa: gcp.serviceaccount.Account,
-        writer_sa: gcp.serviceaccount.Account,
-        dns_sa: gcp.serviceaccount.Account,
-        pulumi_sa: gcp.serviceaccount.Account,
-        storage_integration_key_json: pulumi.Output[str] | None = None,
-    ):
-        self.nodepool_sa = nodepool_sa
-        self.reader_sa = reader_sa
-        self.writer_sa = writer_sa
-        self.dns_sa = dns_sa
-        self.pulumi_sa = pulumi_sa
-        self.storage_integration_key_json = storage_integration_key_json
+    nodepool_sa: gcp.serviceaccount.Account
+    reader_sa: gcp.serviceaccount.Account
+    writer_sa: gcp.serviceaccount.Account
+    dns_sa: gcp.serviceaccount.Account
+    pulumi_sa: gcp.serviceaccount.Account
+    storage_integration_key_json: pulumi.Output[str] | None = None
 
 
+@dataclass(slots=True)
 class GKEResult:
-    def __init__(
-        self,
-        cluster: gcp.container.Cluster,
-        node_pools: list[gcp.container.NodePool],
-        service_accounts: ServiceAccounts,
-        kubeconfig: pulumi.Output[str],
-        k8s_provider: k8s.Provider,
-    ):
-        self.cluster = cluster
-        self.node_pools = node_pools
-        self.service_accounts = service_accounts
-        self.kubeconfig = kubeconfig
-        self.k8s_provider = k8s_provider
+    cluster: gcp.container.Cluster
+    node_pools: list[gcp.container.NodePool]
+    service_accounts: ServiceAccounts
+    kubeconfig: pulumi.Output[str]
+    k8s_provider: k8s.Provider
 
 
 class GKE(pulumi.ComponentResource):
@@ -69,12 +105,14 @@ class GKE(pulumi.ComponentResource):
     ):
         super().__init__("pinecone:byoc:GKE", name, None, opts)
 
-        self._cell_name = pulumi.Output.from_input(cell_name)
-        self._resource_suffix = self._cell_name.apply(lambda cn: cn[-4:])
+        self._cell_name = as_output(cell_name)
+        self._labels = config.labels()
+        workload_pool = f"{config.project}.svc.id.goog"
+        child_opts = pulumi.ResourceOptions(parent=self)
 
         cluster = gcp.container.Cluster(
             f"{name}-cluster",
-            name=self._cell_name.apply(lambda cn: f"cluster-{cn}"),
+            name=pulumi.Output.concat("cluster-", self._cell_name),
             location=config.region,
             node_locations=config.availability_zones,
             network=network_id,
@@ -101,7 +139,7 @@ class GKE(pulumi.ComponentResource):
                 ]
             ),
             workload_identity_config=gcp.container.ClusterWorkloadIdentityConfigArgs(
-                workload_pool=f"{config.project}.svc.id.goog"
+                workload_pool=workload_pool
             ),
             addons_config=gcp.container.ClusterAddonsConfigArgs(
                 dns_cache_config=gcp.container.ClusterAddonsConfigDnsCacheConfigArgs(enabled=True),
@@ -121,106 +159,50 @@ class GKE(pulumi.ComponentResource):
             ),
             # intentionally tied to database deletion_protection - protects both cluster and DB together
             deletion_protection=config.database.deletion_protection,
-            resource_labels=config.labels(),
-            opts=pulumi.ResourceOptions(parent=self),
+            resource_labels=self._labels,
+            opts=child_opts,
         )
 
-        nodepool_sa = gcp.serviceaccount.Account(
-            f"{name}-np-sa",
-            account_id=self._cell_name.apply(lambda cn: _sa_id("np", cn)),
-            display_name=self._cell_name.apply(lambda cn: f"Nodepool service account for {cn}"),
-            opts=pulumi.ResourceOptions(parent=self),
-        )
-
-        reader_sa = gcp.serviceaccount.Account(
-            f"{name}-read-sa",
-            account_id=self._cell_name.apply(lambda cn: _sa_id("read", cn)),
-            display_name=self._cell_name.apply(lambda cn: f"Reader service account for {cn}"),
-            opts=pulumi.ResourceOptions(parent=self),
-        )
-
-        writer_sa = gcp.serviceaccount.Account(
-            f"{name}-write-sa",
-            account_id=self._cell_name.apply(lambda cn: _sa_id("write", cn)),
-            display_name=self._cell_name.apply(lambda cn: f"Writer service account for {cn}"),
-            opts=pulumi.ResourceOptions(parent=self),
-        )
-
-        dns_sa = gcp.serviceaccount.Account(
-            f"{name}-dns-sa",
-            account_id=self._cell_name.apply(lambda cn: _sa_id("dns", cn)),
-            display_name=self._cell_name.apply(lambda cn: f"DNS service account for {cn}"),
-            opts=pulumi.ResourceOptions(parent=self),
-        )
-
-        pulumi_sa = gcp.serviceaccount.Account(
-            f"{name}-pulumi-sa",
-            account_id=self._cell_name.apply(lambda cn: _sa_id("pulumi", cn)),
-            display_name=self._cell_name.apply(lambda cn: f"Pulumi service account for {cn}"),
-            opts=pulumi.ResourceOptions(parent=self),
-        )
-
-        gcp.projects.IAMMember(
-            f"{name}-np-sa-iam",
-            project=config.project,
-            member=nodepool_sa.email.apply(lambda email: f"serviceAccount:{email}"),
-            role="roles/iam.serviceAccountAdmin",
-            opts=pulumi.ResourceOptions(parent=self),
-        )
-
-        gcp.projects.IAMMember(
-            f"{name}-np-sa-storage",
-            project=config.project,
-            member=nodepool_sa.email.apply(lambda email: f"serviceAccount:{email}"),
-            role="roles/storage.admin",
-            opts=pulumi.ResourceOptions(parent=self),
-        )
-
-        gcp.projects.IAMMember(
-            f"{name}-read-sa-storage",
-            project=config.project,
-            member=reader_sa.email.apply(lambda email: f"serviceAccount:{email}"),
-            role="roles/storage.objectViewer",
-            opts=pulumi.ResourceOptions(parent=self),
-        )
-
-        gcp.projects.IAMMember(
-            f"{name}-write-sa-storage",
-            project=config.project,
-            member=writer_sa.email.apply(lambda email: f"serviceAccount:{email}"),
-            role="roles/storage.admin",
-            opts=pulumi.ResourceOptions(parent=self),
-        )
-
-        gcp.projects.IAMMember(
-            f"{name}-write-sa-iam",
-            project=config.project,
-            member=writer_sa.email.apply(lambda email: f"serviceAccount:{email}"),
-            role="roles/iam.serviceAccountAdmin",
-            opts=pulumi.ResourceOptions(parent=self),
-        )
-
-        gcp.projects.IAMMember(
-            f"{name}-dns-sa",
-            project=config.project,
-            member=dns_sa.email.apply(lambda email: f"serviceAccount:{email}"),
-            role="roles/dns.admin",
-            opts=pulumi.ResourceOptions(parent=self),
-        )
+        accounts: dict[str, gcp.serviceaccount.Account] = {}
+        members: dict[str, pulumi.Output[str]] = {}
+        for prefix, resource_suffix, description in _SERVICE_ACCOUNT_SPECS:
+            account = gcp.serviceaccount.Account(
+                f"{name}-{resource_suffix}",
+                account_id=self._cell_name.apply(partial(_sa_id, prefix)),
+                display_name=pulumi.Output.concat(
+                    f"{description} service account for ", self._cell_name
+                ),
+                opts=child_opts,
+            )
+            accounts[prefix] = account
+            members[prefix] = pulumi.Output.concat("serviceAccount:", account.email)
+
+        nodepool_sa = accounts["np"]
+        reader_sa = accounts["read"]
+        writer_sa = accounts["write"]
+        dns_sa = accounts["dns"]
+        pulumi_sa = accounts["pulumi"]
+        # storage integration SA for data-importer GCS access
+        storage_integration_sa = accounts["si"]
+
+        for resource_suffix, prefix, role in _PROJECT_IAM_ROLES:
+            gcp.projects.IAMMember(
+                f"{name}-{resource_suffix}",
+                project=config.project,
+                member=members[prefix],
+                role=role,
+                opts=child_opts,
+            )
 
         # cert-manager K8s SA -> DNS GCP SA for ACME challenges
         gcp.serviceaccount.IAMBinding(
             f"{name}-dns-sa-workload-identity",
             service_account_id=dns_sa.name,
             role="roles/iam.workloadIdentityUser",
-            members=[
-                pulumi.Output.all(config.project, self._cell_name).apply(
-                    lambda args: (
-                        f"serviceAccount:{args[0]}.svc.id.goog[gloo-system/certmanager-certgen]"
-                    )
-                )
-            ],
-            opts=pulumi.ResourceOptions(parent=self, depends_on=[dns_sa]),
+            members=[f"serviceAccount:{workload_pool}[gloo-system/certmanager-certgen]"],
+            opts=pulumi.ResourceOptions.merge(
+                child_opts, pulumi.ResourceOptions(depends_on=[dns_sa])
+            ),
         )
 
         # pulumi-operator K8s SA -> Pulumi GCP SA for GCS state access
@@ -229,21 +211,11 @@ class GKE(pulumi.ComponentResource):
             service_account_id=pulumi_sa.name,
             role="roles/iam.workloadIdentityUser",
             members=[
-                pulumi.Output.all(config.project, self._cell_name).apply(
-                    lambda args: (
-                        f"serviceAccount:{args[0]}.svc.id.goog[pulumi-kubernetes-operator/pulumi-k8s-operator]"
-                    )
-                )
+                f"serviceAccount:{workload_pool}[pulumi-kubernetes-operator/pulumi-k8s-operator]"
             ],
-            opts=pulumi.ResourceOptions(parent=self, depends_on=[pulumi_sa]),
-        )
-
-        gcp.projects.IAMMember(
-            f"{name}-pulumi-sa-k8s",
-            project=config.project,
-            member=pulumi_sa.email.apply(lambda email: f"serviceAccount:{email}"),
-            role="roles/container.serviceAgent",
-            opts=pulumi.ResourceOptions(parent=self),
+            opts=pulumi.ResourceOptions.merge(
+                child_opts, pulumi.ResourceOptions(depends_on=[pulumi_sa])
+            ),
         )
 
         # writer K8s SAs -> write GCP SA for GCS/AlloyDB access (non-authoritative
@@ -254,10 +226,10 @@ class GKE(pulumi.ComponentResource):
                 f"{name}-writer-wi-{sanitized}",
                 service_account_id=writer_sa.name,
                 role="roles/iam.workloadIdentityUser",
-                member=pulumi.Output.all(config.project).apply(
-                    lambda args, sa=sa: f"serviceAccount:{args[0]}.svc.id.goog[{sa}]"
+                member=f"serviceAccount:{workload_pool}[{sa}]",
+                opts=pulumi.ResourceOptions.merge(
+                    child_opts, pulumi.ResourceOptions(depends_on=[writer_sa])
                 ),
-                opts=pulumi.ResourceOptions(parent=self, depends_on=[writer_sa]),
             )
 
         # reader K8s SAs -> read GCP SA for GCS read-only access
@@ -265,90 +237,52 @@ class GKE(pulumi.ComponentResource):
             f"{name}-reader-sa-workload-identity",
             service_account_id=reader_sa.name,
             role="roles/iam.workloadIdentityUser",
-            members=pulumi.Output.all(config.project).apply(
-                lambda args: [
-                    f"serviceAccount:{args[0]}.svc.id.goog[{sa}]"
-                    for sa in config.reader_k8s_service_accounts
-                ]
-            ),
-            opts=pulumi.ResourceOptions(parent=self, depends_on=[reader_sa]),
-        )
-
-        # storage integration SA for data-importer GCS access
-        storage_integration_sa = gcp.serviceaccount.Account(
-            f"{name}-storage-integration-sa",
-            account_id=self._cell_name.apply(lambda cn: _sa_id("si", cn)),
-            display_name=self._cell_name.apply(
-                lambda cn: f"Storage integration service account for {cn}"
+            members=[
+                f"serviceAccount:{workload_pool}[{sa}]" for sa in config.reader_k8s_service_accounts
+            ],
+            opts=pulumi.ResourceOptions.merge(
+                child_opts, pulumi.ResourceOptions(depends_on=[reader_sa])
             ),
-            opts=pulumi.ResourceOptions(parent=self),
-        )
-
-        gcp.projects.IAMMember(
-            f"{name}-storage-integration-sa-storage",
-            project=config.project,
-            member=storage_integration_sa.email.apply(lambda email: f"serviceAccount:{email}"),
-            role="roles/storage.objectViewer",
-            opts=pulumi.ResourceOptions(parent=self),
         )
 
         storage_integration_key = gcp.serviceaccount.Key(
             f"{name}-storage-integration-key",
             service_account_id=storage_integration_sa.name,
-            opts=pulumi.ResourceOptions(parent=self, depends_on=[storage_integration_sa]),
+            opts=pulumi.ResourceOptions.merge(
+                child_opts, pulumi.ResourceOptions(depends_on=[storage_integration_sa])
+            ),
         )
 
         storage_integration_key_json = storage_integration_key.private_key.apply(
             lambda k: base64.b64decode(k).decode()
         )
 
-        node_pools = []
-        for np_config in config.node_pools:
-            node_pool = self._create_node_pool(
+        nodepool_sa_email = nodepool_sa.email
+        node_pools = [
+            self._create_node_pool(
                 name=name,
                 config=config,
                 np_config=np_config,
                 cluster_id=cluster.id,
-                nodepool_sa_email=nodepool_sa.email,
-            )
-            node_pools.append(node_pool)
-
-        kubeconfig = pulumi.Output.all(
-            cluster.master_auth.cluster_ca_certificate,
-            cluster.endpoint,
-            cluster.name,
-        ).apply(
-            lambda args: (
-                f"""apiVersion: v1
-clusters:
-- cluster:
-    certificate-authority-data: {args[0]}
-    server: https://{args[1]}
-  name: {args[2]}
-contexts:
-- context:
-    cluster: {args[2]}
-    user: {args[2]}
-  name: {args[2]}
-current-context: {args[2]}
-kind: Config
-preferences: {{}}
-users:
-- name: {args[2]}
-  user:
-    exec:
-      apiVersion: client.authentication.k8s.io/v1beta1
-      command: gke-gcloud-auth-plugin
-      installHint: Install gke-gcloud-auth-plugin for use with kubectl
-      provideClusterInfo: true
-"""
+                nodepool_sa_email=nodepool_sa_email,
+                opts=child_opts,
             )
+            for np_config in config.node_pools
+        ]
+
+        kubeconfig = pulumi.Output.format(
+            _KUBECONFIG_TEMPLATE,
+            ca=cluster.master_auth.cluster_ca_certificate,
+            endpoint=cluster.endpoint,
+            name=cluster.name,
         )
 
         k8s_provider = k8s.Provider(
             f"{name}-k8s-provider",
             kubeconfig=kubeconfig,
-            opts=pulumi.ResourceOptions(parent=self, depends_on=[cluster]),
+            opts=pulumi.ResourceOptions.merge(
+                child_opts, pulumi.ResourceOptions(depends_on=[cluster])
+            ),
         )
 
         service_accounts = ServiceAccounts(
@@ -382,21 +316,22 @@ users:
         np_config: NodePoolConfig,
         cluster_id: pulumi.Output[str],
         nodepool_sa_email: pulumi.Output[str],
+        opts: pulumi.ResourceOptions,
     ) -> gcp.container.NodePool:
-        base_labels = dict(np_config.labels) if np_config.labels else {}
-        base_labels["nodepool_name"] = np_config.name
-        base_labels.update(config.labels())
+        base_labels = {**(np_config.labels or {}), "nodepool_name": np_config.name, **self._labels}
 
         labels = self._cell_name.apply(lambda cn: {"pinecone.io/cell": cn, **base_labels})
 
-        taints = [
-            gcp.container.NodePoolNodeConfigTaintArgs(
-                key=taint.key,
-                value=str(taint.value),
-                effect=taint.effect,
-            )
-            for taint in (np_config.taints or [])
-        ]
+        taints = None
+        if np_config.taints:
+            taints = [
+                gcp.container.NodePoolNodeConfigTaintArgs(
+                    key=taint.key,
+                    value=str(taint.value),
+                    effect=taint.effect,
+                )
+                for taint in np_config.taints
+            ]
 
         autoscaling = gcp.container.NodePoolAutoscalingArgs(
             min_node_count=np_config.min_size,
@@ -414,8 +349,8 @@ users:
                 machine_type=np_config.machine_type,
                 min_cpu_platform="Intel Ice Lake",
                 labels=labels,
-                resource_labels=config.labels(),
-                taints=taints or None,
+                resource_labels=self._labels,
+                taints=taints,
                 oauth_scopes=["https://www.googleapis.com/auth/cloud-platform"],
                 service_account=nodepool_sa_email,
             ),
@@ -424,7 +359,7 @@ users:
                 auto_repair=False,
                 auto_upgrade=False,
             ),
-            opts=pulumi.ResourceOptions(parent=self),
+            opts=opts,
         )
 
         return node_pool
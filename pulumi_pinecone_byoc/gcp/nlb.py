@@ -1,5 +1,7 @@
 """Internal load balancer with Private Service Connect."""
 
+import asyncio
+import random
 import time
 
 import pulumi
@@ -8,7 +10,17 @@ import pulumi_kubernetes as k8s
 
 from config.gcp import GCPConfig
 
-from ..common.naming import DNS_CNAMES
+from ..common.naming import DNS_CNAME_SLUGS, as_output
+
+LB_LOOKUP_TIMEOUT_SECONDS = 300
+
+_PLACEHOLDER_TLS_IGNORE_CHANGES = ["data", "stringData", "metadata.annotations", "metadata.labels"]
+# the netstack Helm release adopts these objects and rewrites their ownership metadata
+_HELM_METADATA_IGNORE_CHANGES = ["metadata.labels", "metadata.annotations"]
+
+
+def _lb_poll_delay(attempt: int) -> float:
+    return min(20, 2 * 1.5**attempt) + random.uniform(0, 1)
 
 
 class InternalLoadBalancer(pulumi.ComponentResource):
@@ -26,9 +38,23 @@ class InternalLoadBalancer(pulumi.ComponentResource):
     ):
         super().__init__("pinecone:byoc:InternalLoadBalancer", name, None, opts)
 
-        self._cell_name = pulumi.Output.from_input(cell_name)
+        self._cell_name = as_output(cell_name)
+        k8s_opts = pulumi.ResourceOptions(parent=self, provider=k8s_provider)
 
         tls_secret_name = subdomain.apply(lambda s: f"{s.split('.')[0]}-tls")
+        ingress_tls = [
+            k8s.networking.v1.IngressTLSArgs(
+                hosts=[
+                    pulumi.Output.concat("*.", subdomain),
+                    pulumi.Output.concat("*.svc.", subdomain),
+                    pulumi.Output.concat("*.private.", subdomain),
+                    pulumi.Output.concat("*.svc.private.", subdomain),
+                ],
+                secret_name=tls_secret_name,
+            )
+        ]
+        ingress_target = pulumi.Output.concat("ingress.", subdomain, ".")
+        private_target = pulumi.Output.concat("private.", subdomain, ".")
 
         # placeholder TLS secret for ingress-gce: it won't configure the LB without this existing.
         # cert-manager overwrites it with the real cert later, ignore_changes prevents Pulumi from reverting
@@ -40,15 +66,11 @@ class InternalLoadBalancer(pulumi.ComponentResource):
             ),
             type="kubernetes.io/tls",
             string_data={"tls.crt": "", "tls.key": ""},
-            opts=pulumi.ResourceOptions(
-                parent=self,
-                provider=k8s_provider,
-                ignore_changes=[
-                    "data",
-                    "stringData",
-                    "metadata.annotations",
-                    "metadata.labels",
-                ],
+            opts=pulumi.ResourceOptions.merge(
+                k8s_opts,
+                pulumi.ResourceOptions(
+                    ignore_changes=_PLACEHOLDER_TLS_IGNORE_CHANGES,
+                ),
             ),
         )
 
@@ -86,32 +108,34 @@ class InternalLoadBalancer(pulumi.ComponentResource):
                     "drainingTimeoutSec": 60,
                 },
             },
-            opts=pulumi.ResourceOptions(
-                parent=self,
-                provider=k8s_provider,
-                ignore_changes=["metadata.labels", "metadata.annotations"],
+            opts=pulumi.ResourceOptions.merge(
+                k8s_opts,
+                pulumi.ResourceOptions(
+                    ignore_changes=_HELM_METADATA_IGNORE_CHANGES,
+                ),
             ),
         )
 
         if public_access_enabled:
             ssl_policy = gcp.compute.SSLPolicy(
                 f"{name}-ssl-policy",
-                name=self._cell_name.apply(lambda cn: f"ssl-policy-{cn}"),
+                name=pulumi.Output.concat("ssl-policy-", self._cell_name),
                 profile="MODERN",
                 min_tls_version="TLS_1_2",
                 opts=pulumi.ResourceOptions(parent=self),
             )
 
+            frontend_config_name = subdomain.apply(lambda s: f"ssl-policy-config-{s.split('.')[0]}")
             frontend_config = k8s.apiextensions.CustomResource(
                 f"{name}-frontend-config",
                 api_version="networking.gke.io/v1beta1",
                 kind="FrontendConfig",
                 metadata=k8s.meta.v1.ObjectMetaArgs(
-                    name=subdomain.apply(lambda s: f"ssl-policy-config-{s.split('.')[0]}"),
+                    name=frontend_config_name,
                     namespace="gloo-system",
                 ),
                 spec={"sslPolicy": ssl_policy.name},
-                opts=pulumi.ResourceOptions(parent=self, provider=k8s_provider),
+                opts=k8s_opts,
             )
 
             k8s.networking.v1.Ingress(
@@ -122,11 +146,9 @@ class InternalLoadBalancer(pulumi.ComponentResource):
                     annotations={
                         "cert-manager.io/issuer": "letsencrypt-prod",
                         "kubernetes.io/ingress.allow-http": "false",
-                        "networking.gke.io/v1beta1.FrontendConfig": subdomain.apply(
-                            lambda s: f"ssl-policy-config-{s.split('.')[0]}"
-                        ),
-                        "kubernetes.io/ingress.global-static-ip-name": self._cell_name.apply(
-                            lambda cn: f"externalip-{cn}"
+                        "networking.gke.io/v1beta1.FrontendConfig": frontend_config_name,
+                        "kubernetes.io/ingress.global-static-ip-name": pulumi.Output.concat(
+                            "externalip-", self._cell_name
                         ),
                     },
                 ),
@@ -152,24 +174,15 @@ class InternalLoadBalancer(pulumi.ComponentResource):
                             ),
                         )
                     ],
-                    tls=[
-                        k8s.networking.v1.IngressTLSArgs(
-                            hosts=[
-                                subdomain.apply(lambda s: f"*.{s}"),
-                                subdomain.apply(lambda s: f"*.svc.{s}"),
-                                subdomain.apply(lambda s: f"*.private.{s}"),
-                                subdomain.apply(lambda s: f"*.svc.private.{s}"),
-                            ],
-                            secret_name=tls_secret_name,
-                        )
-                    ],
+                    tls=ingress_tls,
                 ),
-                opts=pulumi.ResourceOptions(
-                    parent=self,
-                    provider=k8s_provider,
-                    delete_before_replace=True,
-                    depends_on=[placeholder_tls_secret, frontend_config],
-                    custom_timeouts=pulumi.CustomTimeouts(create="20m", update="20m"),
+                opts=pulumi.ResourceOptions.merge(
+                    k8s_opts,
+                    pulumi.ResourceOptions(
+                        delete_before_replace=True,
+                        depends_on=[placeholder_tls_secret, frontend_config],
+                        custom_timeouts=pulumi.CustomTimeouts(create="20m", update="20m"),
+                    ),
                 ),
             )
 
@@ -219,51 +232,41 @@ class InternalLoadBalancer(pulumi.ComponentResource):
                         ),
                     )
                 ],
-                tls=[
-                    k8s.networking.v1.IngressTLSArgs(
-                        hosts=[
-                            subdomain.apply(lambda s: f"*.{s}"),
-                            subdomain.apply(lambda s: f"*.svc.{s}"),
-                            subdomain.apply(lambda s: f"*.private.{s}"),
-                            subdomain.apply(lambda s: f"*.svc.private.{s}"),
-                        ],
-                        secret_name=tls_secret_name,
-                    )
-                ],
+                tls=ingress_tls,
             ),
-            opts=pulumi.ResourceOptions(
-                parent=self,
-                provider=k8s_provider,
-                delete_before_replace=True,
-                depends_on=[backend_config, placeholder_tls_secret],
-                custom_timeouts=pulumi.CustomTimeouts(create="20m", update="20m"),
+            opts=pulumi.ResourceOptions.merge(
+                k8s_opts,
+                pulumi.ResourceOptions(
+                    delete_before_replace=True,
+                    depends_on=[backend_config, placeholder_tls_secret],
+                    custom_timeouts=pulumi.CustomTimeouts(create="20m", update="20m"),
+                ),
             ),
         )
 
-        def get_lb_ip_and_link(_ingress_status, cell_name_str: str, retries: int = 30):
-            for attempt in range(retries):
+        async def get_lb_ip_and_link(_ingress_status, cell_name_str: str):
+            deadline = time.monotonic() + LB_LOOKUP_TIMEOUT_SECONDS
+            attempt = 0
+            while time.monotonic() < deadline:
+                attempt += 1
                 try:
-                    rules = gcp.compute.get_forwarding_rules(config.project, config.region)
+                    rules = await gcp.compute.get_forwarding_rules_output(
+                        config.project, config.region
+                    ).future()
                     lb = next(
                         (
                             r
-                            for r in rules.rules
+                            for r in (rules.rules if rules else [])
                             if r.subnetwork and r.subnetwork.endswith(cell_name_str)
                         ),
                         None,
                     )
-                    if lb is None:
-                        pulumi.log.info(
-                            f"no matching LB found (attempt {attempt + 1}/{retries}), retrying..."
-                        )
-                        time.sleep(10)
-                        continue
-                    return (lb.ip_address, lb.self_link)
+                    if lb is not None:
+                        return {"ip_address": lb.ip_address, "self_link": lb.self_link}
+                    pulumi.log.info(f"no matching LB found (attempt {attempt}), retrying...")
                 except Exception as e:
-                    pulumi.log.info(
-                        f"waiting for internal lb (attempt {attempt + 1}/{retries})... {e}"
-                    )
-                    time.sleep(10)
+                    pulumi.log.info(f"waiting for internal lb (attempt {attempt})... {e}")
+                await asyncio.sleep(_lb_poll_delay(attempt - 1))
             raise Exception("failed to get internal LB after retries")
 
         # wait for Ingress status to be ready, then query the LB
@@ -271,12 +274,12 @@ class InternalLoadBalancer(pulumi.ComponentResource):
             lambda args: get_lb_ip_and_link(args[0], args[1])
         )
 
-        lb_ip = lb_info.apply(lambda info: info[0])
-        lb_link = lb_info.apply(lambda info: info[1])
+        lb_ip = lb_info["ip_address"]
+        lb_link = lb_info["self_link"]
 
         service_attachment = gcp.compute.ServiceAttachment(
             f"{name}-service-attachment",
-            name=self._cell_name.apply(lambda cn: f"{config.resource_prefix}-psc-{cn}"),
+            name=pulumi.Output.concat(f"{config.resource_prefix}-psc-", self._cell_name),
             region=config.region,
             description="Pinecone service attachment",
             connection_preference="ACCEPT_AUTOMATIC",
@@ -285,7 +288,6 @@ class InternalLoadBalancer(pulumi.ComponentResource):
             target_service=lb_link,
             opts=pulumi.ResourceOptions(
                 parent=self,
-                depends_on=[ingress],
                 delete_before_replace=True,
                 retain_on_delete=False,
             ),
@@ -294,36 +296,36 @@ class InternalLoadBalancer(pulumi.ComponentResource):
         private_ingress_a_record = gcp.dns.RecordSet(
             f"{name}-private-ingress-a-record",
             managed_zone=dns_zone_name,
-            name=subdomain.apply(lambda s: f"private.{s}."),
+            name=private_target,
             type="A",
             rrdatas=[lb_ip],
             ttl=300,
-            opts=pulumi.ResourceOptions(parent=self, depends_on=[ingress]),
+            opts=pulumi.ResourceOptions(parent=self),
         )
 
         public_cname_records = []
         if public_access_enabled:
-            for cname in DNS_CNAMES:
+            for cname, slug in DNS_CNAME_SLUGS:
                 public_cname = gcp.dns.RecordSet(
-                    f"{name}-{cname.replace('*.', 'wildcard-').replace('.', '-')}-public-cname",
+                    f"{name}-{slug}-public-cname",
                     managed_zone=dns_zone_name,
-                    name=subdomain.apply(lambda s, c=cname: f"{c}.{s}."),
+                    name=pulumi.Output.concat(f"{cname}.", subdomain, "."),
                     type="CNAME",
                     ttl=300,
-                    rrdatas=[subdomain.apply(lambda s: f"ingress.{s}.")],
+                    rrdatas=[ingress_target],
                     opts=pulumi.ResourceOptions(parent=self, depends_on=[ingress]),
                 )
                 public_cname_records.append(public_cname)
 
         private_cname_records = []
-        for cname in DNS_CNAMES:
+        for cname, slug in DNS_CNAME_SLUGS:
             private_cname = gcp.dns.RecordSet(
-                f"{name}-{cname.replace('*.', 'wildcard-').replace('.', '-')}-private-cname",
+                f"{name}-{slug}-private-cname",
                 managed_zone=dns_zone_name,
-                name=subdomain.apply(lambda s, c=cname: f"{c}.private.{s}."),
+                name=pulumi.Output.concat(f"{cname}.", private_target),
                 type="CNAME",
                 ttl=300,
-                rrdatas=[subdomain.apply(lambda s: f"private.{s}.")],
+                rrdatas=[private_target],
                 opts=pulumi.ResourceOptions(parent=self, depends_on=[ingress]),
             )
             private_cname_records.append(private_cname)
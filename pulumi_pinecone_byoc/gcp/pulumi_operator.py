@@ -6,6 +6,8 @@ import pulumi_kubernetes as k8s
 
 from config.gcp import GCPConfig
 
+from ..common.naming import as_output
+
 
 class PulumiOperator(pulumi.ComponentResource):
     def __init__(
@@ -21,14 +23,15 @@ class PulumiOperator(pulumi.ComponentResource):
         super().__init__("pinecone:byoc:PulumiOperator", name, None, opts)
 
         self.config = config
-        self._cell_name = pulumi.Output.from_input(cell_name)
+        self._cell_name = as_output(cell_name)
         self._operator_namespace = operator_namespace
+        self._labels = config.labels()
         child_opts = pulumi.ResourceOptions(parent=self)
         self._state_bucket = self._create_state_bucket(name, child_opts)
         self._kms_key = self._create_kms_key(name, child_opts)
         self._create_iam_bindings(name, pulumi_sa_email, child_opts)
-        self._backend_url = self._state_bucket.name.apply(lambda bucket: f"gs://{bucket}")
-        self._secrets_provider = self._kms_key.id.apply(lambda key_id: f"gcpkms://{key_id}")
+        self._backend_url = pulumi.Output.concat("gs://", self._state_bucket.name)
+        self._secrets_provider = pulumi.Output.concat("gcpkms://", self._kms_key.id)
 
         self.register_outputs(
             {
@@ -40,7 +43,7 @@ class PulumiOperator(pulumi.ComponentResource):
         )
 
     def _create_state_bucket(self, name: str, opts: pulumi.ResourceOptions) -> gcp.storage.Bucket:
-        bucket_name = self._cell_name.apply(lambda cn: f"pc-pulumi-state-{cn}")
+        bucket_name = pulumi.Output.concat("pc-pulumi-state-", self._cell_name)
 
         bucket = gcp.storage.Bucket(
             f"{name}-state-bucket",
@@ -71,7 +74,7 @@ class PulumiOperator(pulumi.ComponentResource):
                     ),
                 ),
             ],
-            labels=self.config.labels(),
+            labels=self._labels,
             opts=opts,
         )
 
@@ -80,7 +83,7 @@ class PulumiOperator(pulumi.ComponentResource):
     def _create_kms_key(self, name: str, opts: pulumi.ResourceOptions) -> gcp.kms.CryptoKey:
         key_ring = gcp.kms.KeyRing(
             f"{name}-pulumi-secrets-keyring",
-            name=self._cell_name.apply(lambda cn: f"pulumi-secrets-{cn}"),
+            name=pulumi.Output.concat("pulumi-secrets-", self._cell_name),
             project=self.config.project,
             location=self.config.region,
             opts=opts,
@@ -92,7 +95,7 @@ class PulumiOperator(pulumi.ComponentResource):
             key_ring=key_ring.id,
             rotation_period="7776000s",  # 90 days
             purpose="ENCRYPT_DECRYPT",
-            labels=self.config.labels(),
+            labels=self._labels,
             opts=opts,
         )
 
@@ -104,11 +107,13 @@ class PulumiOperator(pulumi.ComponentResource):
         pulumi_sa_email: pulumi.Output[str],
         opts: pulumi.ResourceOptions,
     ):
+        member = pulumi.Output.concat("serviceAccount:", pulumi_sa_email)
+
         gcp.storage.BucketIAMMember(
             f"{name}-state-bucket-access",
             bucket=self._state_bucket.name,
             role="roles/storage.objectAdmin",
-            member=pulumi_sa_email.apply(lambda e: f"serviceAccount:{e}"),
+            member=member,
             opts=opts,
         )
 
@@ -116,7 +121,7 @@ class PulumiOperator(pulumi.ComponentResource):
             f"{name}-kms-key-access",
             crypto_key_id=self._kms_key.id,
             role="roles/cloudkms.cryptoKeyEncrypterDecrypter",
-            member=pulumi_sa_email.apply(lambda e: f"serviceAccount:{e}"),
+            member=member,
             opts=opts,
         )
 
@@ -7,6 +7,13 @@ import pulumi_gcp as gcp
 
 from config.gcp import GCPConfig
 
+from ..common.naming import as_output
+
+PSC_SUBNET_CIDR = "10.100.1.0/24"
+PROXY_SUBNET_CIDR = "10.100.2.0/24"
+PSC_SUBNET_NET = ipaddress.ip_network(PSC_SUBNET_CIDR)
+PROXY_SUBNET_NET = ipaddress.ip_network(PROXY_SUBNET_CIDR)
+
 
 class VPC(pulumi.ComponentResource):
     def __init__(
@@ -19,24 +26,22 @@ class VPC(pulumi.ComponentResource):
         super().__init__("pinecone:byoc:VPC", name, None, opts)
 
         self.config = config
-        self._cell_name = pulumi.Output.from_input(cell_name)
+        self._cell_name = as_output(cell_name)
         child_opts = pulumi.ResourceOptions(parent=self)
 
         # validate VPC CIDR doesn't overlap with hardcoded subnets
         vpc_net = ipaddress.ip_network(config.vpc_cidr)
-        psc_net = ipaddress.ip_network("10.100.1.0/24")
-        proxy_net = ipaddress.ip_network("10.100.2.0/24")
-
-        if vpc_net.overlaps(psc_net) or vpc_net.overlaps(proxy_net):
+        if vpc_net.overlaps(PSC_SUBNET_NET) or vpc_net.overlaps(PROXY_SUBNET_NET):
             raise ValueError(
                 f"VPC CIDR {config.vpc_cidr} overlaps with reserved ranges: "
-                "10.100.1.0/24 (Private Service Connect), 10.100.2.0/24 (Regional Managed Proxy). "
+                f"{PSC_SUBNET_CIDR} (Private Service Connect), "
+                f"{PROXY_SUBNET_CIDR} (Regional Managed Proxy). "
                 "Please choose a VPC CIDR that doesn't overlap with 10.100.0.0/16."
             )
 
         self.network = gcp.compute.Network(
             f"{name}-network",
-            name=self._cell_name.apply(lambda cn: f"network-{cn}"),
+            name=pulumi.Output.concat("network-", self._cell_name),
             project=config.project,
             auto_create_subnetworks=False,
             opts=child_opts,
@@ -44,7 +49,7 @@ class VPC(pulumi.ComponentResource):
 
         self.main_subnet = gcp.compute.Subnetwork(
             f"{name}-subnet",
-            name=self._cell_name.apply(lambda cn: f"subnet-{cn}"),
+            name=pulumi.Output.concat("subnet-", self._cell_name),
             project=config.project,
             region=config.region,
             network=self.network.id,
@@ -55,22 +60,22 @@ class VPC(pulumi.ComponentResource):
 
         self.psc_subnet = gcp.compute.Subnetwork(
             f"{name}-private-subnet",
-            name=self._cell_name.apply(lambda cn: f"private-subnet-{cn}"),
+            name=pulumi.Output.concat("private-subnet-", self._cell_name),
             project=config.project,
             region=config.region,
             network=self.network.id,
-            ip_cidr_range="10.100.1.0/24",
+            ip_cidr_range=PSC_SUBNET_CIDR,
             purpose="PRIVATE_SERVICE_CONNECT",
             opts=child_opts,
         )
 
         self.proxy_subnet = gcp.compute.Subnetwork(
             f"{name}-private-proxy-network",
-            name=self._cell_name.apply(lambda cn: f"private-proxy-network-{cn}"),
+            name=pulumi.Output.concat("private-proxy-network-", self._cell_name),
             project=config.project,
             region=config.region,
             network=self.network.id,
-            ip_cidr_range="10.100.2.0/24",
+            ip_cidr_range=PROXY_SUBNET_CIDR,
             purpose="REGIONAL_MANAGED_PROXY",
             role="ACTIVE",
             opts=child_opts,
@@ -78,7 +83,7 @@ class VPC(pulumi.ComponentResource):
 
         self.private_ip_range = gcp.compute.GlobalAddress(
             f"{name}-private-ip-range",
-            name=self._cell_name.apply(lambda cn: f"private-ip-range-{cn}"),
+            name=pulumi.Output.concat("private-ip-range-", self._cell_name),
             project=config.project,
             network=self.network.id,
             purpose="VPC_PEERING",
@@ -92,12 +97,12 @@ class VPC(pulumi.ComponentResource):
             network=self.network.id,
             service="servicenetworking.googleapis.com",
             reserved_peering_ranges=[self.private_ip_range.name],
-            opts=pulumi.ResourceOptions(parent=self, depends_on=[self.private_ip_range]),
+            opts=child_opts,
         )
 
         self.router = gcp.compute.Router(
             f"{name}-router",
-            name=self._cell_name.apply(lambda cn: f"router-{cn}"),
+            name=pulumi.Output.concat("router-", self._cell_name),
             project=config.project,
             region=config.region,
             network=self.network.id,
@@ -106,7 +111,7 @@ class VPC(pulumi.ComponentResource):
 
         self.nat = gcp.compute.RouterNat(
             f"{name}-nat",
-            name=self._cell_name.apply(lambda cn: f"nat-{cn}"),
+            name=pulumi.Output.concat("nat-", self._cell_name),
             project=config.project,
             region=config.region,
             router=self.router.name,